@@ -1,13 +1,21 @@
 from abc import abstractmethod
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from http.cookiejar import CookieJar
 from requests import Response
+from threading import Lock
 from time import sleep
 from time import time
 from typing import Optional, Union
 from typing import Any
+from typing import BinaryIO
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
 from typing import Optional
 from typing import Union
 from urllib.parse import quote
+from urllib.parse import urlsplit
 from urllib.robotparser import RobotFileParser
 
 
@@ -15,6 +23,7 @@ from .connection import CookieDict
 from .connection import get
 from .connection import make_session
 from .connection import stream_binary
+from .connection import stream_binary_to
 from .exceptions import DisallowedPath
 from .exceptions import Unauthorized
 from bs4 import BeautifulSoup
@@ -34,20 +43,64 @@ class FAAPI_BASE(FAAPI_ABC):
         self.robots = robots
         self.timeout = timeout
         self.raise_for_unauthorized = raise_for_unauthorized
+        self._load_robots_settings()
+        self._delay_lock: Lock = Lock()
+        self._host_last_get: dict[str, float] = {}
+        self._pools_lock: Lock = Lock()
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        self._file_pool: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def _executor(self) -> ThreadPoolExecutor:
+        # The pools are only started when something is fetched in the background
+        with self._pools_lock:
+            if self._prefetch_pool is None:
+                self._prefetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="faapi")
+            return self._prefetch_pool
+
+    @property
+    def _file_executor(self) -> ThreadPoolExecutor:
+        with self._pools_lock:
+            if self._file_pool is None:
+                self._file_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="faapi-files")
+            return self._file_pool
+
+    def close(self):
+        """
+        Shut down the worker threads and close the session.
+        The worker threads are started again if the object is used after closing it.
+        """
+        with self._pools_lock:
+            pools: tuple[Optional[ThreadPoolExecutor], ...] = (self._prefetch_pool, self._file_pool)
+            self._prefetch_pool = self._file_pool = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+        self.session.close()
+
+    def _load_robots_settings(self):
+        self._user_agent: str = self.session.headers["User-Agent"]
+        self._crawl_delay: float = float(self.robots.crawl_delay(self._user_agent) or 1)
 
     @property
     def user_agent(self) -> str:
         """
         The user agent of the session
         """
-        return self.session.headers["User-Agent"]
+        return self._user_agent
 
     @property
     def crawl_delay(self) -> float:
         """
         Crawl delay from robots.txt
         """
-        return float(self.robots.crawl_delay(self.user_agent) or 1)
+        return self._crawl_delay
 
     def load_cookies(self, cookies: Union[list[CookieDict], CookieJar]):
         """
@@ -56,14 +109,24 @@ class FAAPI_BASE(FAAPI_ABC):
         :param cookies: The cookies for the session.
         """
         self.session = make_session(cookies)
+        self._load_robots_settings()
 
-    def handle_delay(self):
+    def handle_delay(self, host: str = ""):
         """
-        Handles the crawl delay as set in the robots.txt
+        Handles the crawl delay as set in the robots.txt.
+        Each caller reserves the next free slot of its host, so requests made from several threads stay spaced by the
+        delay, while requests to different hosts (e.g. SoFurry user subdomains) do not wait on each other.
+
+        :param host: The host the request is made to.
         """
-        if (d := time() - self.last_get) < self.crawl_delay:
-            sleep(self.crawl_delay - d)
-        self.last_get = time()
+        with self._delay_lock:
+            now: float = time()
+            next_get: float = max(now, self._host_last_get.get(host, now - self.crawl_delay) + self.crawl_delay)
+            self._host_last_get[host] = next_get
+            self.last_get = max(self.last_get, next_get)
+            wait: float = next_get - now
+        if wait > 0:
+            sleep(wait)
 
     def check_path(self, path: str, *, raise_for_disallowed: bool = False) -> bool:
         """
@@ -100,8 +163,9 @@ class FAAPI_BASE(FAAPI_ABC):
         :return: A Response object from the request.
         """
         self.check_path(path, raise_for_disallowed=True)
-        self.handle_delay()
-        return get(self.session, root if root else self.root(), path, timeout=self.timeout, params=params)
+        root = root if root else self.root()
+        self.handle_delay(urlsplit(root).netloc)
+        return get(self.session, root, path, timeout=self.timeout, params=params)
 
     def get_parsed(self, path: str, *, root: Optional[str] = None, skip_page_check: bool = False, skip_auth_check: bool = False, output: dict[str,Response] | None = None,
                    **params: Union[str, bytes, int, float]) -> BeautifulSoup:
@@ -116,7 +180,8 @@ class FAAPI_BASE(FAAPI_ABC):
         """
         response: Response = self.get(path, root = root, **params)
         response.raise_for_status()
-        page: BeautifulSoup = parse_html_page(response.text)
+        # Decode with the declared charset, falling back to UTF-8 instead of running charset detection
+        page: BeautifulSoup = parse_html_page(response.content.decode(response.encoding or "utf-8", "replace"))
         if not skip_page_check:
             self.check_page_raise(page)
         if not skip_auth_check and self.raise_for_unauthorized and not self.parse_loggedin_user(page):
@@ -133,15 +198,75 @@ class FAAPI_BASE(FAAPI_ABC):
     def check_page_raise(self, page: BeautifulSoup) -> None:
         ...
 
-    def submission_files(self, submission: Submission, *, chunk_size: Optional[int] = None) -> bytes:
+    def submission_files(self, submission: Submission, *, chunk_size: Optional[int] = None,
+                         out: Optional[BinaryIO] = None) -> list[bytes]:
         """
-        Fetch a submission file from a Submission object.
+        Fetch the submission files from a Submission object.
+        Multiple files are downloaded in parallel, each request still waits for the crawl delay before starting.
 
         :param submission: A Submission object.
         :param chunk_size: The chunk_size to be used for the download.
-        :return: The submission file as a bytes object.
+        :param out: A binary file the files are written to one after the other instead of being kept in memory.
+        :return: The submission files as bytes objects, in the same order as the file URLs, or an empty list if out is
+            given.
         """
         def submission_file(file_url):
-            self.handle_delay()
+            self.handle_delay(urlsplit(file_url).netloc)
             return stream_binary(self.session, file_url, chunk_size=chunk_size, timeout=self.timeout)
-        return [submission_file(file_url) for file_url in parse_multipart_field(submission.file_url)]
+
+        file_urls: list[str] = parse_multipart_field(submission.file_url)
+        if out is not None:
+            for file_url in file_urls:
+                self.handle_delay(urlsplit(file_url).netloc)
+                stream_binary_to(self.session, file_url, out, chunk_size=chunk_size, timeout=self.timeout)
+            return []
+        if len(file_urls) == 1:
+            return [submission_file(file_urls[0])]
+        # A separate pool from the one used by iter_pages/iter_submissions, so a submission fetched in the background
+        # never waits on its own files queued behind it
+        return list(self._file_executor.map(submission_file, file_urls))
+
+    def iter_pages(self, fetch: Callable[[Any], tuple[list[Any], Optional[Any], list[Any]]], page: Any = None
+                   ) -> Iterator[list[Any]]:
+        """
+        Iterate over the pages of a folder, following next pages and subpages.
+        The next pending page is fetched in a background thread while the current one is being consumed.
+
+        :param fetch: A folder method bound to a user, e.g. functools.partial(api.gallery, "user").
+        :param page: The page to start from.
+        :return: An iterator yielding the items of each page.
+        """
+        pending_pages: list[Any] = [page]
+        future: Optional[Future] = self._executor.submit(fetch, pending_pages.pop())
+        while future is not None:
+            items, next_page, subpages = future.result()
+            pending_pages.extend(subpages)
+            if next_page is not None:
+                pending_pages.append(next_page)
+            future = self._executor.submit(fetch, pending_pages.pop()) if pending_pages else None
+            yield items
+
+    def iter_submissions(self, submission_ids: Iterable[int], get_file: bool = False, *,
+                         chunk_size: Optional[int] = None) -> Iterator[tuple[Submission, list[bytes]]]:
+        """
+        Iterate over a sequence of submissions.
+        The next submission is fetched in a background thread while the current one is being consumed, the crawl
+        delay is still enforced between requests.
+
+        :param submission_ids: The IDs of the submissions.
+        :param get_file: Whether to download the submission files.
+        :param chunk_size: The chunk_size to be used for the download (does not override get_file).
+        :return: An iterator yielding the results of submission for each ID.
+        """
+        ids: Iterator[int] = iter(submission_ids)
+
+        def fetch_next() -> Optional[Future]:
+            if (submission_id := next(ids, None)) is None:
+                return None
+            return self._executor.submit(self.submission, submission_id, get_file, chunk_size=chunk_size)
+
+        future: Optional[Future] = fetch_next()
+        while future is not None:
+            result: tuple[Submission, list[bytes]] = future.result()
+            future = fetch_next()
+            yield result
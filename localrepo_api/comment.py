@@ -2,6 +2,7 @@ from __future__ import annotations
 from dataclasses import KW_ONLY, dataclass
 
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional, Type
 from typing import Union
 
@@ -11,6 +12,7 @@ from localrepo_api.interface.faapi_abc import FAAPI_ABC
 from .exceptions import _raise_exception
 
 from localrepo_api.user import UserPartial
+from localrepo_api.user import epoch
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -24,7 +26,10 @@ class Comment:
     Contains comment information and references to replies and parent objects.
     """
 
-    @dataclass
+    __slots__ = ("comment_tag", "id", "author", "date", "text", "replies", "reply_to", "edited", "hidden", "parent",
+                 "parserClass", "_author_dict", "_parent_dict")
+
+    @dataclass(slots=True)
     class Record:
         _: KW_ONLY
         id: int
@@ -45,8 +50,7 @@ class Comment:
         self.comment_tag: Optional[Comment.Record] = tag
 
         self.id: int = 0
-        self.author: UserPartial = UserPartial(parserClass)
-        self.date: datetime = datetime.fromtimestamp(0)
+        self.date: datetime = epoch
         self.text: str = ""
         self.replies: list[Comment] = []
         self.reply_to: Optional[Union[Comment, int]] = None
@@ -54,15 +58,21 @@ class Comment:
         self.hidden: bool = False
         self.parent: Optional[Union[Submission, Journal]] = parent
         self.parserClass = parserClass
+        self._author_dict: Optional[tuple[UserPartial, dict]] = None
+        self._parent_dict: Optional[tuple[Union[Submission, Journal], dict]] = None
 
         self.parse()
 
+        # parse() builds the author from the tag, only tagless comments need an empty one
+        if self.comment_tag is None:
+            self.author: UserPartial = UserPartial(parserClass)
+
     def __hash__(self) -> int:
-        return hash((self.id, type(self.parent), self.parent))
+        return hash((self.id, type(self.parent), None if self.parent is None else self.parent.id))
 
     def __eq__(self, other) -> bool:
         if isinstance(other, Comment):
-            return other.id == self.id and self.parent == other.parent
+            return other.id == self.id and (self.parent is other.parent or self.parent == other.parent)
         elif isinstance(other, int):
             return other == self.id
         return False
@@ -97,15 +107,24 @@ class Comment:
 
     def __iter__(self):
         yield "id", self.id
-        yield "author", dict(self.author)
+        yield "author", self._cached_author_dict()
         yield "date", self.date
         yield "text", self.text
         yield "replies", [dict(r) for r in self.replies]
-        yield "reply_to", dict(_remove_recursion(self.reply_to)) if isinstance(self.reply_to, Comment) \
-            else self.reply_to
+        yield "reply_to", self.reply_to.id if isinstance(self.reply_to, Comment) else self.reply_to
         yield "edited", self.edited
         yield "hidden", self.hidden
-        yield "parent", None if self.parent is None else dict(self.parent)
+        yield "parent", None if self.parent is None else self._cached_parent_dict(self.parent)
+
+    def _cached_author_dict(self) -> dict:
+        if self._author_dict is None or self._author_dict[0] is not self.author:
+            self._author_dict = (self.author, dict(self.author))
+        return dict(self._author_dict[1])
+
+    def _cached_parent_dict(self, parent: Union[Submission, Journal]) -> dict:
+        if self._parent_dict is None or self._parent_dict[0] is not parent:
+            self._parent_dict = (parent, dict(parent))
+        return dict(self._parent_dict[1])
 
     def __repr__(self):
         return self.__str__()
@@ -152,6 +171,7 @@ class Comment:
         self.reply_to = self.comment_tag.parent
         self.edited = self.comment_tag.edited
         self.hidden = self.comment_tag.hidden
+        self._author_dict = self._parent_dict = None
 
 
 def sort_comments(comments: list[Comment]) -> list[Comment]:
@@ -161,10 +181,14 @@ def sort_comments(comments: list[Comment]) -> list[Comment]:
     :param comments: A list of Comment objects (flat or tree-structured)
     :return: A tree-structured list of comments with replies
     """
-    print(comments)
-    for comment in (comments := sorted(flatten_comments(comments))):
-        print(comment)
-        comment.replies = [_set_reply_to(c, comment) for c in comments if c.reply_to == comment]
+    comments = flatten_comments(comments)
+    replies: dict[int, list[Comment]] = {}
+    for comment in comments:
+        if comment.reply_to is not None:
+            reply_to_id: int = comment.reply_to.id if isinstance(comment.reply_to, Comment) else comment.reply_to
+            replies.setdefault(reply_to_id, []).append(comment)
+    for comment in comments:
+        comment.replies = [_set_reply_to(c, comment) for c in replies.get(comment.id, [])]
     return [c for c in comments if c.reply_to is None]
 
 
@@ -175,7 +199,14 @@ def flatten_comments(comments: list[Comment]) -> list[Comment]:
     :param comments: A list of Comment objects (flat or tree-structured)
     :return: A flat date-sorted (ascending) list of comments
     """
-    return sorted({c for c in [r for c in comments for r in [c, *flatten_comments(c.replies)]]})
+    flat: set[Comment] = set()
+    stack: list[Comment] = list(reversed(comments))
+    while stack:
+        if (comment := stack.pop()) not in flat:
+            flat.add(comment)
+            stack.extend(reversed(comment.replies))
+    # Sort on the plain integer ids rather than through Comment.__lt__
+    return sorted(flat, key=attrgetter("id"))
 
 
 def _set_reply_to(comment: Comment, reply_to: Union[Comment, int]) -> Comment:
@@ -4,6 +4,8 @@ from http.cookiejar import CookieJar
 from platform import python_version
 from platform import uname
 from re import compile as re_compile
+from typing import Any
+from typing import BinaryIO
 from typing import Optional
 from typing import TypedDict
 from typing import Union
@@ -13,12 +15,20 @@ from cfscrape import CloudflareScraper  # type: ignore
 from cfscrape import create_scraper  # type: ignore
 from requests import Response
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 from .__version__ import __version__
 from .exceptions import Unauthorized
-from .exceptions import _raise_exception
+
+try:
+    from orjson import loads as json_loads  # type: ignore
+except ImportError:
+    from json import loads as json_loads
 
 root: str = "https://www.furaffinity.net"
+stream_chunk_size: int = 64 * 1024
 
 
 class CookieDict(TypedDict):
@@ -30,11 +40,28 @@ def join_url(*url_comps: Union[str, int]) -> str:
     return "/".join(map(lambda e: str(e).strip(" /"), url_comps))
 
 
+def load_json(response: Response) -> Any:
+    return json_loads(response.content)
+
+
 def make_session(cookies: Union[list[CookieDict], CookieJar], raise_for_no_cookies: bool = True) -> CloudflareScraper:
     if raise_for_no_cookies:
-        assert len(cookies), _raise_exception(Unauthorized("No cookies for session"))
+        if not len(cookies):
+            raise Unauthorized("No cookies for session")
     session: CloudflareScraper = create_scraper()
     session.headers["User-Agent"] = f"faapi/{__version__} Python/{python_version()} {(u := uname()).system}/{u.release}"
+    session.headers["Connection"] = "keep-alive"
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+    # SoFurry serves each user from their own subdomain, keep enough host pools so they are not evicted while crawling
+    # 503 is left to cfscrape, which needs it to solve the Cloudflare challenge, and the last response is returned
+    # instead of raising so status checks still see it
+    adapter: HTTPAdapter = HTTPAdapter(
+        pool_connections=16, pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 504], raise_on_status=False)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
 
     for cookie in cookies:
         if isinstance(cookie, Cookie):
@@ -57,12 +84,53 @@ def get(session: CloudflareScraper, root: str, path: str, *, timeout: Optional[i
 
 def stream_binary(session: CloudflareScraper, url: str, *, chunk_size: Optional[int] = None,
                   timeout: Optional[int] = None) -> bytes:
-    stream: Response = session.get(url, stream=True, timeout=timeout)
+    stream: Response = session.get(url, stream=True, timeout=timeout, headers={"Accept-Encoding": "identity"})
     stream.raise_for_status()
 
-    file_binary: bytes = bytes().join(stream.iter_content(chunk_size))
+    # Content-Length counts the bytes on the wire, so it only sizes the buffer and checks the result for identity bodies
+    if stream.headers.get("Content-Encoding", "identity") != "identity":
+        return bytes().join(stream.iter_content(chunk_size))
+
+    length: int = int(stream.headers.get("Content-Length", 0))
+
+    if length <= 0:
+        return bytes().join(stream.iter_content(chunk_size))
+
+    stream.raw.decode_content = False
+    buffer: bytearray = bytearray(length)
+    view: memoryview = memoryview(buffer)
+    read: int = 0
+    while read < length and (n := stream.raw.readinto(view[read:read + (chunk_size or stream_chunk_size)])):
+        read += n
+    view.release()
+    if read != length:
+        raise IncompleteRead(bytes(buffer[:read]), length - read)
+
+    return bytes(buffer)
+
+
+def stream_binary_to(session: CloudflareScraper, url: str, out: BinaryIO, *, chunk_size: Optional[int] = None,
+                     timeout: Optional[int] = None) -> int:
+    stream: Response = session.get(url, stream=True, timeout=timeout, headers={"Accept-Encoding": "identity"})
+    stream.raise_for_status()
+
+    # Decoded bytes cannot be checked against Content-Length, which counts the bytes on the wire
+    if stream.headers.get("Content-Encoding", "identity") != "identity":
+        return sum(map(out.write, stream.iter_content(chunk_size)))
+
+    length: int = int(stream.headers.get("Content-Length", 0))
+
+    # A single chunk buffer is reused for the whole download, only the bytes read are handed to the output
+    stream.raw.decode_content = False
+    buffer: bytearray = bytearray(chunk_size or stream_chunk_size)
+    view: memoryview = memoryview(buffer)
+    written: int = 0
+    while n := stream.raw.readinto(view):
+        out.write(view[:n])
+        written += n
+    view.release()
 
-    if (length := int(stream.headers.get("Content-Length", 0))) > 0 and length != len(file_binary):
-        raise IncompleteRead(file_binary, length - len(file_binary))
+    if length > 0 and length != written:
+        raise IncompleteRead(b"", length - written)
 
-    return file_binary
+    return written
@@ -4,7 +4,6 @@ from time import time
 from typing import Any
 from typing import Optional
 from typing import Union
-from urllib.parse import quote
 from urllib.robotparser import RobotFileParser
 
 from localrepo_api.base import FAAPI_BASE
@@ -30,14 +29,36 @@ from .furaffinity_parser import parse_user_favorites
 from .furaffinity_parser import parse_user_journals
 from .furaffinity_parser import parse_user_submissions
 from .furaffinity_parser import parse_watchlist
+from .furaffinity_parser import username_path
 from .furaffinity_parser import username_url
 from .furaffinity_parser import html_to_bbcode
 from ..submission import Submission
 from ..submission import SubmissionPartial
 from ..user import User
 from ..user import UserPartial
+from ..user import UserStats
 from . import furaffinity_parser
 
+tag_search_options: dict[str, str] = {
+    "do_search": "Search",
+    "order-by": "date",
+    "order-direction": "desc",
+    "range": "all",
+    "range_from": "",
+    "range_to": "",
+    "rating-general": "1",
+    "rating-mature": "1",
+    "rating-adult": "1",
+    "type-art": "1",
+    "type-music": "1",
+    "type-flash": "1",
+    "type-story": "1",
+    "type-photo": "1",
+    "type-poetry": "1",
+    "mode": "extended",
+    "one": "on",
+}
+
 
 class FAAPI(FAAPI_BASE):
     """
@@ -90,7 +111,10 @@ class FAAPI(FAAPI_BASE):
         page_parsed: BeautifulSoup = self.get_parsed("/")
         submission_tags = parse_submission_figures(page_parsed)
         submissions: list[SubmissionPartial] = [SubmissionPartial(FAAPI, SubmissionPartial.Record(**parse_submission_figure(f))) for f in submission_tags]
-        return sorted({s for s in submissions}, reverse=True)
+        unique_submissions: dict[int, SubmissionPartial] = {}
+        for submission in submissions:
+            unique_submissions.setdefault(submission.id, submission)
+        return [s for _, s in sorted(unique_submissions.items(), reverse=True)]
 
     def submission(self, submission_id: int, get_file: bool = False, *, chunk_size: Optional[int] = None
                    ) -> tuple[Submission, list[bytes]]:
@@ -144,7 +168,7 @@ class FAAPI(FAAPI_BASE):
         :param user: The name of the user (_ characters are allowed).
         :return: A User object.
         """
-        beautifulSoup = self.get_parsed(join_url("user", quote(username_url(user))))
+        beautifulSoup = self.get_parsed(join_url("user", username_path(user)))
         parsed_user = parse_user_page(beautifulSoup)
         watch = parsed_user.pop("watch")
         unwatch = parsed_user.pop("unwatch")
@@ -154,9 +178,9 @@ class FAAPI(FAAPI_BASE):
         parsed_user["watched_toggle_link"] = watch or unwatch or None
         parsed_user["blocked"] = block is None and unblock is not None
         parsed_user["blocked_toggle_link"] = block or unblock or None
+        parsed_user["stats"] = UserStats(*parsed_user["stats"])
         return User(FAAPI, User.Record(**parsed_user))
 
-    # noinspection DuplicatedCode
     def gallery(self, user: str, page: Any = 1) -> tuple[list[SubmissionPartial], Optional[Any], list[Any]]:
         """
         Fetch a user's gallery page.
@@ -165,23 +189,8 @@ class FAAPI(FAAPI_BASE):
         :param page: The page to fetch.
         :return: A list of SubmissionPartial objects and the next page (None if it is the last).
         """
-        if page is None:
-            page = 1
-        page_parsed: BeautifulSoup = self.get_parsed(join_url("gallery", quote(username_url(user)), int(page)))
-        info_parsed: dict[str, Any] = parse_user_submissions(page_parsed)
-        author: UserPartial = UserPartial(FAAPI)
-        user_info = info_parsed["user_info"]
-        author.name, author.status, author.title, author.join_date, author.avatar_url = [
-            user_info["name"], user_info["status"],
-            user_info["title"], user_info["join_date"],
-            user_info["avatar_url"]
-        ]
-        submissions = [SubmissionPartial(FAAPI, SubmissionPartial.Record(**parse_submission_figure(tag))) for tag in info_parsed["figures"]]
-        for s in submissions:
-            s.author = author
-        return (submissions, (page + 1) if not info_parsed["last_page"] else None, [])
+        return self._user_submissions("gallery", user, page)
 
-    # noinspection DuplicatedCode
     def scraps(self, user: str, page: Any = 1) -> tuple[list[SubmissionPartial], Optional[Any], list[Any]]:
         """
         Fetch a user's scraps page.
@@ -190,20 +199,24 @@ class FAAPI(FAAPI_BASE):
         :param page: The page to fetch.
         :return: A list of SubmissionPartial objects and the next page (None if it is the last).
         """
+        return self._user_submissions("scraps", user, page)
+
+    def _user_submissions(self, folder: str, user: str, page: Any
+                          ) -> tuple[list[SubmissionPartial], Optional[Any], list[Any]]:
         if page is None:
             page = 1
-        page_parsed: BeautifulSoup = self.get_parsed(join_url("scraps", quote(username_url(user)), int(page)))
+        page_parsed: BeautifulSoup = self.get_parsed(join_url(folder, username_path(user), int(page)))
         info_parsed: dict[str, Any] = parse_user_submissions(page_parsed)
-        author: UserPartial = UserPartial(FAAPI)
-        user_info = info_parsed["user_info"]
-        author.name, author.status, author.title, author.join_date, author.avatar_url = [
-            user_info["name"], user_info["status"],
-            user_info["title"], user_info["join_date"],
-            user_info["avatar_url"]
-        ]
-        submissions = [SubmissionPartial(FAAPI, SubmissionPartial.Record(**parse_submission_figure(tag))) for tag in info_parsed["figures"]]
-        for s in submissions:
-            s.author = author
+        user_info: dict[str, Any] = info_parsed["user_info"]
+        author: UserPartial = UserPartial(FAAPI, UserPartial.Record(
+            name=user_info["name"],
+            status=user_info["status"],
+            title=user_info["title"],
+            join_date=user_info["join_date"],
+            avatar_url=user_info["avatar_url"],
+        ))
+        submissions = [SubmissionPartial(FAAPI, SubmissionPartial.Record(**parse_submission_figure(tag)), author=author)
+                       for tag in info_parsed["figures"]]
         return (submissions, (page + 1) if not info_parsed["last_page"] else None, [])
 
     def favorites(self, user: str, page: Any = "") -> tuple[list[SubmissionPartial], Optional[Any], list[Any]]:
@@ -216,7 +229,7 @@ class FAAPI(FAAPI_BASE):
         """
         if page is None:
             page = ""
-        page_parsed: BeautifulSoup = self.get_parsed(join_url("favorites", quote(username_url(user)), page.strip()))
+        page_parsed: BeautifulSoup = self.get_parsed(join_url("favorites", username_path(user), page.strip()))
         info_parsed: dict[str, Any] = parse_user_favorites(page_parsed)
         submissions = [SubmissionPartial(FAAPI, SubmissionPartial.Record(**parse_submission_figure(tag))) for tag in info_parsed["figures"]]
 
@@ -233,27 +246,7 @@ class FAAPI(FAAPI_BASE):
         """
         if page is None:
             page = 1
-        options = {
-            "page": page,
-            "q": "@keywords+{}".format(tag),
-            "do_search": "Search",
-            "order-by": "date",
-            "order-direction": "desc",
-            "range": "all",
-            "range_from": "",
-            "range_to": "",
-            "rating-general": "1",
-            "rating-mature": "1",
-            "rating-adult": "1",
-            "type-art": "1",
-            "type-music": "1",
-            "type-flash": "1",
-            "type-story": "1",
-            "type-photo": "1",
-            "type-poetry": "1",
-            "mode": "extended",
-            "one": "on"
-        }
+        options = {"page": page, "q": f"@keywords+{tag}", **tag_search_options}
         page_parsed: BeautifulSoup = self.get_parsed(
             "search",
             **options)
@@ -273,19 +266,18 @@ class FAAPI(FAAPI_BASE):
         """
         if page == None:
             page = 1
-        page_parsed: BeautifulSoup = self.get_parsed(join_url("journals", quote(username_url(user)), int(page)))
+        page_parsed: BeautifulSoup = self.get_parsed(join_url("journals", username_path(user), int(page)))
         info_parsed: dict[str, Any] = parse_user_journals(page_parsed)
-        author: UserPartial = UserPartial(FAAPI)
-        author.name, author.status, author.title, author.join_date, author.avatar_url = [
-            info_parsed["name"], info_parsed["status"],
-            info_parsed["title"], info_parsed["join_date"],
-            info_parsed["avatar_url"]
-        ]
+        author: UserPartial = UserPartial(FAAPI, UserPartial.Record(
+            name=info_parsed["name"],
+            status=info_parsed["status"],
+            title=info_parsed["title"],
+            join_date=info_parsed["join_date"],
+            avatar_url=info_parsed["avatar_url"],
+        ))
         journals = [
-            JournalPartial(FAAPI, JournalPartial.Record(**parse_journal_section(tag)))
+            JournalPartial(FAAPI, JournalPartial.Record(**parse_journal_section(tag)), author=author)
                 for tag in info_parsed["sections"]]
-        for j in journals:
-            j.author = author
         return (journals, (page + 1) if not info_parsed["last_page"] else None, [])
 
     def watchlist_to(self, user: str, page: Any = None) -> tuple[list[UserPartial], Optional[Any], list[Any]]:
@@ -297,14 +289,9 @@ class FAAPI(FAAPI_BASE):
         :return: A list of UserPartial objects and the next page (None if it is the last).
         """
         page = page or 1
-        users: list[UserPartial] = []
         us, np = parse_watchlist(
-            self.get_parsed(join_url("watchlist", "to", quote(username_url(user)), page), skip_auth_check=True))
-        for s, u in us:
-            _user: UserPartial = UserPartial(FAAPI)
-            _user.name = u
-            _user.status = s
-            users.append(_user)
+            self.get_parsed(join_url("watchlist", "to", username_path(user), page), skip_auth_check=True))
+        users: list[UserPartial] = [UserPartial.from_watchlist(FAAPI, u, s) for s, u in us]
         return (users, np if np and np != page else None, [])
 
     def watchlist_by(self, user: str, page: Any = None) -> tuple[list[UserPartial], Optional[Any], list[Any]]:
@@ -315,14 +302,9 @@ class FAAPI(FAAPI_BASE):
         :return: A list of UserPartial objects and the next page (None if it is the last).
         """
         page = page or 1
-        users: list[UserPartial] = []
         us, np = parse_watchlist(
-            self.get_parsed(join_url("watchlist", "by", quote(username_url(user)), page), skip_auth_check=True))
-        for s, u in us:
-            _user: UserPartial = UserPartial(FAAPI)
-            _user.name = u
-            _user.status = s
-            users.append(_user)
+            self.get_parsed(join_url("watchlist", "by", username_path(user), page), skip_auth_check=True))
+        users: list[UserPartial] = [UserPartial.from_watchlist(FAAPI, u, s) for s, u in us]
         return (users, np if np and np != page else None, [])
 
     def parse_loggedin_user(self, page: BeautifulSoup) -> Optional[str]:
@@ -333,7 +315,7 @@ class FAAPI(FAAPI_BASE):
 
     @staticmethod
     def html_to_bbcode(html: str) -> str:
-        return html_to_bbcode(str)
+        return html_to_bbcode(html)
 
     @staticmethod
     def username_url(username: str) -> str:
@@ -1,6 +1,9 @@
 from os.path import split
+from urllib.parse import quote
 from urllib.parse import unquote
+from datetime import date
 from datetime import datetime
+from functools import lru_cache
 from re import MULTILINE
 from re import Match
 from re import Pattern
@@ -8,6 +11,7 @@ from re import compile as re_compile
 from re import match
 from re import search
 from re import sub
+from sys import intern
 from typing import Any
 from typing import Optional
 from typing import Union
@@ -17,10 +21,12 @@ from bs4 import BeautifulSoup
 from bs4.element import NavigableString
 from bs4.element import Tag
 from dateutil.parser import parse as parse_date
+from soupsieve import SoupSieve
+from soupsieve import compile as css_compile
 from htmlmin import minify # type:ignore
 from urllib3.util import parse_url
 
-from localrepo_api.parse import parse_html_page, clean_html, inner_html
+from localrepo_api.parse import parse_html_page, clean_html, inner_html, normalize_username
 
 from ..exceptions import DisabledAccount
 from ..exceptions import NoTitle
@@ -29,7 +35,6 @@ from ..exceptions import NotFound
 from ..exceptions import NoticeMessage
 from ..exceptions import ParsingError
 from ..exceptions import ServerError
-from ..exceptions import _raise_exception
 
 root = "https://furaffinity.net"
 
@@ -72,8 +77,14 @@ def check_page_raise(page: BeautifulSoup) -> None:
             raise NoticeMessage(*filter(bool, map(str.strip, notice_text.splitlines())))
 
 
+@lru_cache(maxsize=4096)
 def username_url(username: str) -> str:
-    return sub(r"[^a-z\d.~`-]", "", username.lower())
+    return normalize_username(username)
+
+
+@lru_cache(maxsize=4096)
+def username_path(username: str) -> str:
+    return quote(username_url(username))
 
 
 
@@ -202,7 +213,8 @@ def html_to_bbcode(html: str) -> str:
     return bbcode.strip(" ")
 
 
-def bbcode_to_html(bbcode: str) -> str:
+@lru_cache(maxsize=1)
+def bbcode_parser(day: date) -> BBCodeParser:
     def render_url(_tag_name, value: str, options: dict[str, str], _parent, _context) -> str:
         return f'<a class="auto_link named_url" href="{options.get("url", "#")}">{value}</a>'
 
@@ -223,6 +235,50 @@ def bbcode_to_html(bbcode: str) -> str:
         name, *classes = options["tag"].split(".")
         return f'<{name} class="{" ".join(classes)}">{value}</{name}>'
 
+    parser: BBCodeParser = BBCodeParser(install_defaults=False, replace_links=False, replace_cosmetic=True)
+    parser.REPLACE_ESCAPE = (
+        ("&", "&amp;"),
+        ("<", "&lt;"),
+        (">", "&gt;"),
+    )
+    parser.REPLACE_COSMETIC = (
+        ("(c)", "&copy;"),
+        ("(r)", "&reg;"),
+        ("(tm)", "&trade;"),
+    )
+
+    for tag in ("i", "b", "u", "s", "sub", "sup", "h1", "h2", "h3", "h3", "h4", "h5", "h6"):
+        parser.add_formatter(tag, render_tags)
+    for align in ("left", "center", "right"):
+        parser.add_simple_formatter(align, f'<code class="bbcode bbcode_{align}">%(value)s</code>')
+
+    parser.add_simple_formatter("spoiler", '<span class="bbcode bbcode_spoiler">%(value)s</span>')
+    parser.add_simple_formatter("url", '<a class="auto_link named_link">%(value)s</a>')
+    parser.add_simple_formatter(
+        "iconusername",
+        f'<a class=iconusername href="/user/%(value)s">'
+        f'<img alt="%(value)s" title="%(value)s" src="//a.furaffinity.net/{day:%Y%m%d}/%(value)s.gif">'
+        f'%(value)s'
+        f'</a>'
+    )
+    parser.add_simple_formatter(
+        "usernameicon",
+        f'<a class=iconusername href="/user/%(value)s">'
+        f'<img alt="%(value)s" title="%(value)s" src="//a.furaffinity.net/{day:%Y%m%d}/%(value)s.gif">'
+        f'</a>'
+    )
+    parser.add_simple_formatter("linkusername", '<a class=linkusername href="/user/%(value)s">%(value)s</a>')
+    parser.add_simple_formatter("hr", "<hr>", standalone=True)
+
+    parser.add_formatter("url", render_url)
+    parser.add_formatter("color", render_color)
+    parser.add_formatter("quote", render_quote)
+    parser.add_formatter("tag", render_tag)
+
+    return parser
+
+
+def bbcode_to_html(bbcode: str) -> str:
     def parse_extra(page: BeautifulSoup) -> BeautifulSoup:
         child: NavigableString
         child_new: Tag
@@ -278,49 +334,9 @@ def bbcode_to_html(bbcode: str) -> str:
 
         return page
 
-    parser: BBCodeParser = BBCodeParser(install_defaults=False, replace_links=False, replace_cosmetic=True)
-    parser.REPLACE_ESCAPE = (
-        ("&", "&amp;"),
-        ("<", "&lt;"),
-        (">", "&gt;"),
-    )
-    parser.REPLACE_COSMETIC = (
-        ("(c)", "&copy;"),
-        ("(r)", "&reg;"),
-        ("(tm)", "&trade;"),
-    )
-
-    for tag in ("i", "b", "u", "s", "sub", "sup", "h1", "h2", "h3", "h3", "h4", "h5", "h6"):
-        parser.add_formatter(tag, render_tags)
-    for align in ("left", "center", "right"):
-        parser.add_simple_formatter(align, f'<code class="bbcode bbcode_{align}">%(value)s</code>')
-
-    parser.add_simple_formatter("spoiler", '<span class="bbcode bbcode_spoiler">%(value)s</span>')
-    parser.add_simple_formatter("url", '<a class="auto_link named_link">%(value)s</a>')
-    parser.add_simple_formatter(
-        "iconusername",
-        f'<a class=iconusername href="/user/%(value)s">'
-        f'<img alt="%(value)s" title="%(value)s" src="//a.furaffinity.net/{datetime.now():%Y%m%d}/%(value)s.gif">'
-        f'%(value)s'
-        f'</a>'
-    )
-    parser.add_simple_formatter(
-        "usernameicon",
-        f'<a class=iconusername href="/user/%(value)s">'
-        f'<img alt="%(value)s" title="%(value)s" src="//a.furaffinity.net/{datetime.now():%Y%m%d}/%(value)s.gif">'
-        f'</a>'
-    )
-    parser.add_simple_formatter("linkusername", '<a class=linkusername href="/user/%(value)s">%(value)s</a>')
-    parser.add_simple_formatter("hr", "<hr>", standalone=True)
-
-    parser.add_formatter("url", render_url)
-    parser.add_formatter("color", render_color)
-    parser.add_formatter("quote", render_quote)
-    parser.add_formatter("tag", render_tag)
-
     bbcode = sub(r"-{5,}", "[hr]", bbcode)
 
-    result_page: BeautifulSoup = parse_extra(parse_html_page(parser.format(bbcode)))
+    result_page: BeautifulSoup = parse_extra(parse_html_page(bbcode_parser(date.today()).format(bbcode)))
     return (result_page.select_one("html > body") or result_page).decode_contents()
 
 
@@ -345,11 +361,16 @@ def parse_journal_section(section_tag: Tag) -> dict[str, Any]:
     tag_content: Optional[Tag] = section_tag.select_one("div.journal-body")
     tag_comments: Optional[Tag] = section_tag.select_one("div.section-footer > a > span")
 
-    assert id_ != 0, _raise_exception(ParsingError("Missing ID"))
-    assert tag_title is not None, _raise_exception(ParsingError("Missing title tag"))
-    assert tag_date is not None, _raise_exception(ParsingError("Missing date tag"))
-    assert tag_content is not None, _raise_exception(ParsingError("Missing content tag"))
-    assert tag_comments is not None, _raise_exception(ParsingError("Missing comments tag"))
+    if id_ == 0:
+        raise ParsingError("Missing ID")
+    if tag_title is None:
+        raise ParsingError("Missing title tag")
+    if tag_date is None:
+        raise ParsingError("Missing date tag")
+    if tag_content is None:
+        raise ParsingError("Missing content tag")
+    if tag_comments is None:
+        raise ParsingError("Missing comments tag")
 
     # noinspection DuplicatedCode
     title: str = tag_title.text.strip()
@@ -382,11 +403,16 @@ def parse_journal_page(journal_page: BeautifulSoup) -> dict[str, Any]:
     tag_content: Optional[Tag] = journal_page.select_one("div.journal-content")
     tag_comments: Optional[Tag] = journal_page.select_one("div.section-footer > span")
 
-    assert tag_id is not None, _raise_exception(ParsingError("Missing ID tag"))
-    assert tag_title is not None, _raise_exception(ParsingError("Missing title tag"))
-    assert tag_date is not None, _raise_exception(ParsingError("Missing date tag"))
-    assert tag_content is not None, _raise_exception(ParsingError("Missing content tag"))
-    assert tag_comments is not None, _raise_exception(ParsingError("Missing comments tag"))
+    if tag_id is None:
+        raise ParsingError("Missing ID tag")
+    if tag_title is None:
+        raise ParsingError("Missing title tag")
+    if tag_date is None:
+        raise ParsingError("Missing date tag")
+    if tag_content is None:
+        raise ParsingError("Missing content tag")
+    if tag_comments is None:
+        raise ParsingError("Missing comments tag")
 
     id_: int = int(tag_id.attrs.get("content", "0").strip("/").split("/")[-1])
     # noinspection DuplicatedCode
@@ -402,7 +428,8 @@ def parse_journal_page(journal_page: BeautifulSoup) -> dict[str, Any]:
     mentions: list[str] = parse_mentions(tag_content)
     comments: int = int(tag_comments.text.strip())
 
-    assert id_ != 0, _raise_exception(ParsingError("Missing ID"))
+    if id_ == 0:
+        raise ParsingError("Missing ID")
 
     return {
         "user_info": user_info,
@@ -423,9 +450,12 @@ def parse_submission_figure(figure_tag: Tag) -> dict[str, Any]:
     tag_author: Optional[Tag] = figure_tag.select_one("figcaption a[href^='/user/']")
     tag_thumbnail: Optional[Tag] = figure_tag.select_one("img")
 
-    assert tag_title is not None, _raise_exception(ParsingError("Missing title tag"))
-    assert tag_author is not None, _raise_exception(ParsingError("Missing author tag"))
-    assert tag_thumbnail is not None, _raise_exception(ParsingError("Missing thumbnail tag"))
+    if tag_title is None:
+        raise ParsingError("Missing title tag")
+    if tag_author is None:
+        raise ParsingError("Missing author tag")
+    if tag_thumbnail is None:
+        raise ParsingError("Missing thumbnail tag")
 
     title: str = get_attr(tag_title, "title")
     author: str = get_attr(tag_author, "title")
@@ -446,13 +476,16 @@ def parse_submission_figure(figure_tag: Tag) -> dict[str, Any]:
 def parse_submission_author(author_tag: Tag) -> dict[str, Any]:
     tag_author: Optional[Tag] = author_tag.select_one("div.submission-id-sub-container")
 
-    assert tag_author is not None, _raise_exception(ParsingError("Missing author tag"))
+    if tag_author is None:
+        raise ParsingError("Missing author tag")
 
     tag_author_name: Optional[Tag] = tag_author.select_one("a > strong")
     tag_author_icon: Optional[Tag] = author_tag.select_one("img.submission-user-icon")
 
-    assert tag_author_name is not None, _raise_exception(ParsingError("Missing author name tag"))
-    assert tag_author_icon is not None, _raise_exception(ParsingError("Missing author icon tag"))
+    if tag_author_name is None:
+        raise ParsingError("Missing author name tag")
+    if tag_author_icon is None:
+        raise ParsingError("Missing author icon tag")
 
     author_name: str = tag_author_name.text.strip()
     author_title: str = ([*filter(bool, [child.strip()
@@ -463,7 +496,7 @@ def parse_submission_author(author_tag: Tag) -> dict[str, Any]:
     author_icon_url: str = "https:" + get_attr(tag_author_icon, "src")
 
     return {
-        "author": author_name,
+        "author": intern(author_name),
         "author_title": author_title,
         "author_icon_url": author_icon_url,
     }
@@ -473,7 +506,8 @@ def parse_submission_page(sub_page: BeautifulSoup) -> dict[str, Any]:
     tag_id: Optional[Tag] = sub_page.select_one("meta[property='og:url']")
     tag_sub_info: Optional[Tag] = sub_page.select_one("div.submission-id-sub-container")
 
-    assert tag_sub_info is not None, _raise_exception(ParsingError("Missing info tag"))
+    if tag_sub_info is None:
+        raise ParsingError("Missing info tag")
 
     tag_title: Optional[Tag] = tag_sub_info.select_one("div.submission-title")
     tag_author: Optional[Tag] = sub_page.select_one("div.submission-id-container")
@@ -488,7 +522,8 @@ def parse_submission_page(sub_page: BeautifulSoup) -> dict[str, Any]:
     tag_info: Optional[Tag] = sub_page.select_one("section.info.text")
     tag_user_folders: list[Tag] = sub_page.select("section.folder-list-container > div > a")
 
-    assert tag_info is not None, _raise_exception(ParsingError("Missing info tag"))
+    if tag_info is None:
+        raise ParsingError("Missing info tag")
 
     tag_category1: Optional[Tag] = tag_info.select_one("span.category-name")
     tag_category2: Optional[Tag] = tag_info.select_one("span.type-name")
@@ -501,25 +536,44 @@ def parse_submission_page(sub_page: BeautifulSoup) -> dict[str, Any]:
     tag_prev: Optional[Tag] = sub_page.select_one("div.submission-content div.favorite-nav a:nth-child(1)")
     tag_next: Optional[Tag] = sub_page.select_one("div.submission-content div.favorite-nav a:last-child")
 
-    assert tag_id is not None, _raise_exception(ParsingError("Missing id tag"))
-    assert tag_title is not None, _raise_exception(ParsingError("Missing title tag"))
-    assert tag_author is not None, _raise_exception(ParsingError("Missing author tag"))
-    assert tag_date is not None, _raise_exception(ParsingError("Missing date tag"))
-    assert tag_views is not None, _raise_exception(ParsingError("Missing views tag"))
-    assert tag_comment_count is not None, _raise_exception(ParsingError("Missing comment count tag"))
-    assert tag_favorites is not None, _raise_exception(ParsingError("Missing favorites tag"))
-    assert tag_rating is not None, _raise_exception(ParsingError("Missing rating tag"))
-    assert tag_type is not None, _raise_exception(ParsingError("Missing type tag"))
-    assert tag_fav is not None, _raise_exception(ParsingError("Missing fav tag"))
-    assert tag_category1 is not None, _raise_exception(ParsingError("Missing category1 tag"))
-    assert tag_category2 is not None, _raise_exception(ParsingError("Missing category2 tag"))
-    assert tag_species is not None, _raise_exception(ParsingError("Missing species tag"))
-    assert tag_gender is not None, _raise_exception(ParsingError("Missing gender tag"))
-    assert tag_description is not None, _raise_exception(ParsingError("Missing description tag"))
-    assert tag_folder is not None, _raise_exception(ParsingError("Missing folder tag"))
-    assert tag_file_url is not None, _raise_exception(ParsingError("Missing file URL tag"))
-    assert tag_prev is not None, _raise_exception(ParsingError("Missing prev tag"))
-    assert tag_next is not None, _raise_exception(ParsingError("Missing next tag"))
+    if tag_id is None:
+        raise ParsingError("Missing id tag")
+    if tag_title is None:
+        raise ParsingError("Missing title tag")
+    if tag_author is None:
+        raise ParsingError("Missing author tag")
+    if tag_date is None:
+        raise ParsingError("Missing date tag")
+    if tag_views is None:
+        raise ParsingError("Missing views tag")
+    if tag_comment_count is None:
+        raise ParsingError("Missing comment count tag")
+    if tag_favorites is None:
+        raise ParsingError("Missing favorites tag")
+    if tag_rating is None:
+        raise ParsingError("Missing rating tag")
+    if tag_type is None:
+        raise ParsingError("Missing type tag")
+    if tag_fav is None:
+        raise ParsingError("Missing fav tag")
+    if tag_category1 is None:
+        raise ParsingError("Missing category1 tag")
+    if tag_category2 is None:
+        raise ParsingError("Missing category2 tag")
+    if tag_species is None:
+        raise ParsingError("Missing species tag")
+    if tag_gender is None:
+        raise ParsingError("Missing gender tag")
+    if tag_description is None:
+        raise ParsingError("Missing description tag")
+    if tag_folder is None:
+        raise ParsingError("Missing folder tag")
+    if tag_file_url is None:
+        raise ParsingError("Missing file URL tag")
+    if tag_prev is None:
+        raise ParsingError("Missing prev tag")
+    if tag_next is None:
+        raise ParsingError("Missing next tag")
 
     tag_footer: Optional[Tag] = tag_description.select_one("div.submission-footer")
 
@@ -530,7 +584,7 @@ def parse_submission_page(sub_page: BeautifulSoup) -> dict[str, Any]:
         if match(r"^[A-Za-z]+ \d+,.*$", get_attr(tag_date, "title"))
         else tag_date.text.strip()
     )
-    tags: list[str] = [t.text.strip() for t in tag_tags]
+    tags: list[str] = [intern(t.text.strip()) for t in tag_tags]
     category: str = tag_category1.text.strip() + " / " + tag_category2.text.strip()
     species: str = tag_species.text.strip()
     gender: str = tag_gender.text.strip()
@@ -560,7 +614,8 @@ def parse_submission_page(sub_page: BeautifulSoup) -> dict[str, Any]:
     for a in tag_user_folders:
         tag_folder_name: Optional[Tag] = a.select_one("span")
         tag_folder_group: Optional[Tag] = a.select_one("strong")
-        assert tag_folder_name is not None, _raise_exception(ParsingError("Missing folder name tag"))
+        if tag_folder_name is None:
+            raise ParsingError("Missing folder name tag")
         user_folders.append((
             tag_folder_name.text.strip(),
             (root + href) if (href := a.attrs.get("href", "")) else "",
@@ -599,9 +654,12 @@ def parse_user_header(user_header: Tag) -> dict[str, Any]:
     tag_title_join_date: Optional[Tag] = user_header.select_one("userpage-nav-user-details username.user-title")
     tag_avatar: Optional[Tag] = user_header.select_one("userpage-nav-avatar img")
 
-    assert tag_status is not None, _raise_exception(ParsingError("Missing name tag"))
-    assert tag_title_join_date is not None, _raise_exception(ParsingError("Missing join date tag"))
-    assert tag_avatar is not None, _raise_exception(ParsingError("Missing user icon tag"))
+    if tag_status is None:
+        raise ParsingError("Missing name tag")
+    if tag_title_join_date is None:
+        raise ParsingError("Missing join date tag")
+    if tag_avatar is None:
+        raise ParsingError("Missing user icon tag")
 
     status: str = ""
     name: str = tag_status.text.strip()
@@ -622,24 +680,46 @@ def parse_user_header(user_header: Tag) -> dict[str, Any]:
     }
 
 
+user_page_selectors: tuple[SoupSieve, ...] = tuple(map(css_compile, (
+    "userpage-nav-header",
+    "site-banner picture img",
+    "div.userpage-profile",
+    "div.userpage-section-right div.table",
+    "a[href*='watchlist/to']",
+    "a[href*='watchlist/by']",
+    "userpage-nav-interface-buttons",
+    'meta[property="og:url"]',
+)))
+user_page_infos_selector: SoupSieve = css_compile("div#userpage-contact-item div.table-row")
+user_page_contacts_selector: SoupSieve = css_compile("div#userpage-contact div.user-contact-user-info")
+
+
 def parse_user_page(user_page: BeautifulSoup) -> dict[str, Any]:
-    tag_user_header: Optional[Tag] = user_page.select_one("userpage-nav-header")
-    tag_user_banner: Optional[Tag] = user_page.select_one("site-banner picture img")
-    tag_profile: Optional[Tag] = user_page.select_one("div.userpage-profile")
-    tag_stats: Optional[Tag] = user_page.select_one("div.userpage-section-right div.table")
-    tag_watchlist_to: Optional[Tag] = user_page.select_one("a[href*='watchlist/to']")
-    tag_watchlist_by: Optional[Tag] = user_page.select_one("a[href*='watchlist/by']")
-    tag_infos: list[Tag] = user_page.select("div#userpage-contact-item div.table-row")
-    tag_contacts: list[Tag] = user_page.select("div#userpage-contact div.user-contact-user-info")
-    tag_user_nav_controls: Optional[Tag] = user_page.select_one("userpage-nav-interface-buttons")
-    tag_meta_url: Optional[Tag] = user_page.select_one('meta[property="og:url"]')
-
-    assert tag_user_header is not None, _raise_exception(ParsingError("Missing user header tag"))
-    assert tag_profile is not None, _raise_exception(ParsingError("Missing profile tag"))
-    assert tag_stats is not None, _raise_exception(ParsingError("Missing stats tag"))
-    assert tag_watchlist_to is not None, _raise_exception(ParsingError("Missing watchlist to tag"))
-    assert tag_watchlist_by is not None, _raise_exception(ParsingError("Missing watchlist by tag"))
-    assert tag_meta_url is not None, _raise_exception(ParsingError("Missing meta tag"))
+    tag_user_header: Optional[Tag]
+    tag_user_banner: Optional[Tag]
+    tag_profile: Optional[Tag]
+    tag_stats: Optional[Tag]
+    tag_watchlist_to: Optional[Tag]
+    tag_watchlist_by: Optional[Tag]
+    tag_user_nav_controls: Optional[Tag]
+    tag_meta_url: Optional[Tag]
+    (tag_user_header, tag_user_banner, tag_profile, tag_stats, tag_watchlist_to, tag_watchlist_by,
+     tag_user_nav_controls, tag_meta_url) = (selector.select_one(user_page) for selector in user_page_selectors)
+    tag_infos: list[Tag] = user_page_infos_selector.select(user_page)
+    tag_contacts: list[Tag] = user_page_contacts_selector.select(user_page)
+
+    if tag_user_header is None:
+        raise ParsingError("Missing user header tag")
+    if tag_profile is None:
+        raise ParsingError("Missing profile tag")
+    if tag_stats is None:
+        raise ParsingError("Missing stats tag")
+    if tag_watchlist_to is None:
+        raise ParsingError("Missing watchlist to tag")
+    if tag_watchlist_by is None:
+        raise ParsingError("Missing watchlist by tag")
+    if tag_meta_url is None:
+        raise ParsingError("Missing meta tag")
 
     tag_watch: Optional[Tag] = None
     tag_block: Optional[Tag] = None
@@ -703,12 +783,15 @@ def parse_comment_tag(tag: Tag) -> dict:
     # tag_parent_link: Optional[Tag] = tag.select_one("a.comment-parent")
     tag_edited: Optional[Tag] = tag.select_one("img.edited")
 
-    assert tag_id is not None, _raise_exception(ParsingError("Missing link tag"))
-    assert tag_body is not None, _raise_exception(ParsingError("Missing body tag"))
+    if tag_id is None:
+        raise ParsingError("Missing link tag")
+    if tag_body is None:
+        raise ParsingError("Missing body tag")
 
     attr_id: Optional[str] = tag_id.attrs.get("id")
 
-    assert attr_id is not None, _raise_exception(ParsingError("Missing id attribute"))
+    if attr_id is None:
+        raise ParsingError("Missing id attribute")
 
     comment_id: int = int(attr_id.removeprefix("cid:"))
     comment_text: str = clean_html(inner_html(tag_body))
@@ -726,9 +809,12 @@ def parse_comment_tag(tag: Tag) -> dict:
             "hidden": True,
         }
 
-    assert tag_username is not None, _raise_exception(ParsingError("Missing user name tag"))
-    assert tag_avatar is not None, _raise_exception(ParsingError("Missing user icon tag"))
-    assert tag_user_title is not None, _raise_exception(ParsingError("Missing user title tag"))
+    if tag_username is None:
+        raise ParsingError("Missing user name tag")
+    if tag_avatar is None:
+        raise ParsingError("Missing user icon tag")
+    if tag_user_title is None:
+        raise ParsingError("Missing user title tag")
 
     attr_timestamp: Optional[str] = tag.attrs.get("data-timestamp")
     attr_avatar: Optional[str] = tag_avatar.attrs.get("src")
@@ -739,14 +825,16 @@ def parse_comment_tag(tag: Tag) -> dict:
     if m := search(r'<a class="comment-parent" href="(#cid:\d+)"', tag.decode_contents()):
         attr_parent_href = m[1]
 
-    assert attr_timestamp is not None, _raise_exception(ParsingError("Missing timestamp attribute"))
-    assert attr_avatar is not None, _raise_exception(ParsingError("Missing user icon src attribute"))
+    if attr_timestamp is None:
+        raise ParsingError("Missing timestamp attribute")
+    if attr_avatar is None:
+        raise ParsingError("Missing user icon src attribute")
 
     parent_id: Optional[int] = int(attr_parent_href.removeprefix("#cid:")) if attr_parent_href else None
 
     return {
         "id": comment_id,
-        "user_name": tag_username.text.strip(),
+        "user_name": intern(tag_username.text.strip()),
         "user_title": tag_user_title.text.strip(),
         "avatar_url": "https:" + attr_avatar,
         "timestamp": int(attr_timestamp),
@@ -757,16 +845,21 @@ def parse_comment_tag(tag: Tag) -> dict:
     }
 
 
+comment_container_selector: SoupSieve = css_compile("div.comment_container")
+
+
 def parse_comments(page: BeautifulSoup) -> list[Tag]:
-    return page.select("div.comment_container")
+    return comment_container_selector.select(page)
 
 
 def parse_user_tag(user_tag: Tag) -> dict[str, Any]:
     tag_status: Optional[Tag] = user_tag.select_one("h2")
     tag_title: Optional[Tag] = user_tag.select_one("span")
 
-    assert tag_status, _raise_exception(ParsingError("Missing status and username tag"))
-    assert tag_title, _raise_exception(ParsingError("Missing title and join date tag"))
+    if not tag_status:
+        raise ParsingError("Missing status and username tag")
+    if not tag_title:
+        raise ParsingError("Missing title and join date tag")
 
     status: str = ""
     name: str = tag_status.text.strip()
@@ -792,7 +885,8 @@ def parse_user_tag(user_tag: Tag) -> dict[str, Any]:
 
 def parse_user_folder(folder_page: BeautifulSoup) -> dict[str, Any]:
     tag_user_header: Optional[Tag] = folder_page.select_one("userpage-nav-header")
-    assert tag_user_header is not None, _raise_exception(ParsingError("Missing user header tag"))
+    if tag_user_header is None:
+        raise ParsingError("Missing user header tag")
     return {
         **parse_user_header(tag_user_header),
     }
@@ -851,7 +945,8 @@ def parse_watchlist(watch_page: BeautifulSoup) -> tuple[list[tuple[str, str]], i
 
     for tag_user in watch_page.select("div.watch-list-items"):
         user_link: Optional[Tag] = tag_user.select_one("a")
-        assert user_link, _raise_exception(ParsingError("Missing user link"))
+        if not user_link:
+            raise ParsingError("Missing user link")
 
         username: str = user_link.text.strip()
         user_link.decompose()
@@ -1,8 +1,6 @@
 from datetime import datetime, timezone
 import functools
 from http.cookiejar import Cookie, CookieJar
-import re
-from re import sub
 from time import sleep
 from time import time
 from typing import Any, Dict, List, Tuple, Type
@@ -11,8 +9,6 @@ from typing import Union
 from urllib.robotparser import RobotFileParser
 from xmlrpc.client import Boolean
 from bs4 import BeautifulSoup
-from dateutil.parser import parse as parse_date
-from dateutil.tz import tzutc
 
 from urllib.parse import quote
 
@@ -22,7 +18,10 @@ from ..connection import CloudflareScraper
 from ..connection import CookieDict
 from ..connection import Response
 from ..connection import get_robots
+from ..connection import load_json
 from ..connection import make_session
+from ..parse import normalize_username
+from ..parse import parse_iso_date
 from ..exceptions import DisallowedPath, NonePage, ParsingError, ServerError
 from ..exceptions import Unauthorized
 from ..journal import Journal, JournalStats
@@ -31,29 +30,34 @@ from ..submission import Submission, SubmissionUserFolder
 from ..submission import SubmissionPartial
 from ..user import User, UserStats
 from ..user import UserPartial
+from ..user import epoch_utc
 from . import inkbunny_parser
 
+ratings: dict[str, str] = {
+    "General": "General",
+    "Mature": "Mature",
+    "Adult": "Explicit",
+}
+
+submission_types: dict[str, str] = {
+    "Comic": "image",
+    "Picture/Pinup": "image",
+    "Writing - Document": "text",
+    "swf": "flash",
+    "mp3": "music",
+}
+
 def convertRating(rating: str) -> str:
-    match rating:
-        case "General":
-            return "General"
-        case "Mature":
-            return "Mature"
-        case "Adult":
-            return "Explicit"
-    raise Exception(f"Unknown rating {rating}")
+    try:
+        return ratings[rating]
+    except KeyError:
+        raise Exception(f"Unknown rating {rating}")
 
 def convertType(type: str) -> str:
-    match type:
-        case "Comic" | "Picture/Pinup":
-            return "image"
-        case "Writing - Document":
-            return "text"
-        case "swf":
-            return "flash"
-        case "mp3":
-            return "music"
-    raise Exception(f"Unknown submission type {type}")
+    try:
+        return submission_types[type]
+    except KeyError:
+        raise Exception(f"Unknown submission type {type}")
 
 # The InkBunny API doesn't use cookies. Instead the session id is passed as a query param.
 # For now, we will reuse the `$0 config cookies` feature but extract the sid from the cookies.
@@ -125,20 +129,21 @@ class InkBunnyFAAPI(FAAPI_BASE):
                    **params: Union[str, bytes, int, float]) -> Any:
         """
         Fetch a path with a GET request and parse it as JSON.
+        The body is decoded with orjson when it is installed, with the standard json module otherwise.
 
         :param path: The path to fetch.
-        :param skip_page_check: Whether to skip checking the parsed page for errors.
-        :param skip_auth_check: Whether to skip checking the parsed page for login status.
+        :param skip_auth_check: Whether to skip checking the response for login status.
         :param params: Query parameters for the request.
-        :return: A BeautifulSoup object containing the parsed content of the request response.
+        :return: The decoded JSON content of the request response.
         """
         response: Response = self.get(path, **params)
-        if not skip_auth_check and self.raise_for_unauthorized and response.status_code == 401:
-            raise Unauthorized("Not logged in")
-        if response.status_code != 401:
+        if response.status_code == 401:
+            if not skip_auth_check and self.raise_for_unauthorized:
+                raise Unauthorized("Not logged in")
+        else:
             response.raise_for_status()
 
-        response_json = response.json()
+        response_json = load_json(response)
         if "error_code" in response_json:
             raise ServerError(f"API response returned error: {response_json['error_message']}")
         return response_json
@@ -210,7 +215,7 @@ class InkBunnyFAAPI(FAAPI_BASE):
                 thumbnail_url = getFirst(submission, THUMBNAIL_PRIORITY),
                 author_title = "",
                 author_icon_url = getFirst(submission, USER_ICON_PRIORITY),
-                date = parse_date(submission["create_datetime"]),
+                date = parse_iso_date(submission["create_datetime"]),
                 tags = sorted([ keyword["keyword_name"] for keyword in submission["keywords"]]),
                 category = "",
                 species = "",
@@ -363,7 +368,7 @@ class InkBunnyFAAPI(FAAPI_BASE):
             name = watch["username"],
             status = "",
             title = "",
-            join_date = datetime.fromtimestamp(0, tz = tzutc()),
+            join_date = epoch_utc,
             user_icon_url = ""
         )) for watch in response["watches"]]
 
@@ -379,8 +384,9 @@ class InkBunnyFAAPI(FAAPI_BASE):
         raise NotImplementedError
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def username_url(username: str) -> str:
-        return sub(r"[^a-z\d.~`-]", "", username.lower())
+        return normalize_username(username)
 
     def parse_loggedin_user(self, bs: BeautifulSoup) -> Optional[str]:
         username_tag = bs.select_one("#usernavigation .loggedin_userdetails a.widget_userNameSmall")
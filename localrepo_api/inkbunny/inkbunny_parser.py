@@ -4,7 +4,6 @@ from re import compile as re_compile
 from re import match
 from re import search
 from re import sub
-import re
 from typing import Any, Dict
 from typing import Optional
 from typing import NewType
@@ -17,6 +16,7 @@ from dateutil.parser import parse as parse_date
 
 from localrepo_api.parse import clean_html, inner_html
 from localrepo_api.user import User, UserStats
+from localrepo_api.user import epoch
 
 from ..exceptions import DisabledAccount, Unauthorized
 from ..exceptions import NoTitle
@@ -28,7 +28,6 @@ from ..exceptions import ServerError
 from ..exceptions import _raise_exception
 
 from abc import ABC, abstractmethod
-from datetime import datetime
 from re import MULTILINE
 from re import Match
 from re import Pattern
@@ -86,33 +85,42 @@ def parse_user_profile(username: str, bs: BeautifulSoup) -> User.Record:
     profile_description = clean_html(inner_html(profile_description_tag))
 
     views_tag = bs.select_one('span[title="Submission Views Received"] > strong')
-    assert views_tag is not None, _raise_exception(ParsingError("Missing views tag"))
+    if views_tag is None:
+        raise ParsingError("Missing views tag")
 
     submissions_tag = bs.select_one('span[title="Submissions Uploaded"] > strong')
-    assert submissions_tag is not None, _raise_exception(ParsingError("Missing submissions tag"))
+    if submissions_tag is None:
+        raise ParsingError("Missing submissions tag")
 
     favorites_tag = bs.select_one('span[title="Favorites Received"] > strong')
-    assert favorites_tag is not None, _raise_exception(ParsingError("Missing favorites tag"))
+    if favorites_tag is None:
+        raise ParsingError("Missing favorites tag")
 
     comments_earned_tag = bs.select_one('span[title="Comments Received"] > strong')
-    assert comments_earned_tag is not None, _raise_exception(ParsingError("Missing comments received tag"))
+    if comments_earned_tag is None:
+        raise ParsingError("Missing comments received tag")
 
     comments_made_tag = bs.select_one('span[title="Comments Given"] > strong')
-    assert comments_made_tag is not None, _raise_exception(ParsingError("Missing comments given tag"))
+    if comments_made_tag is None:
+        raise ParsingError("Missing comments given tag")
 
     journals_tag = bs.select_one('span[title="Journals Created"] > strong')
-    assert journals_tag is not None, _raise_exception(ParsingError("Missing journals tag"))
+    if journals_tag is None:
+        raise ParsingError("Missing journals tag")
 
     watchers_tag = bs.select_one('span[title="Watches Received"] > strong')
-    assert watchers_tag is not None, _raise_exception(ParsingError("Missing watchers tag"))
+    if watchers_tag is None:
+        raise ParsingError("Missing watchers tag")
 
     watches_tag = bs.select_one('#watches strong')
-    assert watches_tag is not None, _raise_exception(ParsingError("Missing watches tag"))
+    if watches_tag is None:
+        raise ParsingError("Missing watches tag")
 
     contacts = parse_contact_details(bs)    
 
     profile_image_tag = bs.select_one('meta[property="og:image"]')
-    assert profile_image_tag is not None, _raise_exception(ParsingError("Missing profile image tag"))
+    if profile_image_tag is None:
+        raise ParsingError("Missing profile image tag")
 
     watchbox_tag = bs.select_one("#widget-watchbox-watchstate")
     # Watchbox doesn't always appear (for example, there's no watchbox when viewing your own profile)
@@ -131,7 +139,7 @@ def parse_user_profile(username: str, bs: BeautifulSoup) -> User.Record:
         status = "",
         profile = profile_description,
         title = "",
-        join_date = datetime.fromtimestamp(0),
+        join_date = epoch,
         stats = UserStats(
             views= locale.atoi(views_tag.text),
             submissions= locale.atoi(submissions_tag.text),
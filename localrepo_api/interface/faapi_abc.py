@@ -3,6 +3,10 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from http.cookiejar import CookieJar
 from typing import Any
+from typing import BinaryIO
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
 from typing import Optional
 from typing import Union
 
@@ -55,9 +59,17 @@ class FAAPI_ABC(ABC):
         """
 
     @abstractmethod
-    def handle_delay(self):
+    def close(self):
         """
-        Handles the crawl delay as set in the robots.txt
+        Shut down the worker threads and close the session.
+        """
+
+    @abstractmethod
+    def handle_delay(self, host: str = ""):
+        """
+        Handles the crawl delay as set in the robots.txt, separately for each host
+
+        :param host: The host the request is made to.
         """
 
     @abstractmethod
@@ -142,15 +154,42 @@ class FAAPI_ABC(ABC):
         """
 
     @abstractmethod
-    def submission_files(self, submission: Submission, *, chunk_size: int = None) -> list[bytes]:
+    def submission_files(self, submission: Submission, *, chunk_size: Optional[int] = None,
+                         out: Optional[BinaryIO] = None) -> list[bytes]:
         """
         Fetch a submission file from a Submission object.
 
         :param submission: A Submission object.
         :param chunk_size: The chunk_size to be used for the download.
+        :param out: A binary file to write the files to instead of returning them.
         :return: The submission file as a bytes object.
         """
 
+    @abstractmethod
+    def iter_pages(self, fetch: Callable[[Any], tuple[list[Any], Optional[Any], list[Any]]], page: Any = None
+                   ) -> Iterator[list[Any]]:
+        """
+        Iterate over the pages of a folder, following next pages and subpages.
+        The next pending page is fetched in a background thread while the current one is being consumed.
+
+        :param fetch: A folder method bound to a user, e.g. functools.partial(api.gallery, "user").
+        :param page: The page to start from.
+        :return: An iterator yielding the items of each page.
+        """
+
+    @abstractmethod
+    def iter_submissions(self, submission_ids: Iterable[int], get_file: bool = False, *,
+                         chunk_size: Optional[int] = None) -> Iterator[tuple[Submission, list[bytes]]]:
+        """
+        Iterate over a sequence of submissions.
+        The next submission is fetched in a background thread while the current one is being consumed.
+
+        :param submission_ids: The IDs of the submissions.
+        :param get_file: Whether to download the submission files.
+        :param chunk_size: The chunk_size to be used for the download (does not override get_file).
+        :return: An iterator yielding the results of submission for each ID.
+        """
+
     @abstractmethod
     def journal(self, journal_id: int) -> Journal:
         """
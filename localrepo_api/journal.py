@@ -11,6 +11,7 @@ from .exceptions import _raise_exception
 from bs4 import BeautifulSoup
 from bs4 import Tag
 from .user import UserPartial
+from .user import epoch
 
 
 class JournalStats(namedtuple("JournalStats", ["comments"])):
@@ -24,7 +25,7 @@ class JournalBase:
     def __init__(self, parserClass: Type[FAAPI_ABC]):
         self.id: int = 0
         self.title: str = ""
-        self.date: datetime = datetime.fromtimestamp(0)
+        self.date: datetime = epoch
         self.author: UserPartial = UserPartial(parserClass)
         self.stats: JournalStats = JournalStats(0)
         self.content: str = ""
@@ -108,7 +109,7 @@ class JournalPartial(JournalBase):
     Contains partial journal information gathered from journals pages.
     """
 
-    @dataclass
+    @dataclass(slots=True)
     class Record:
         _: KW_ONLY
         id: int
@@ -123,9 +124,11 @@ class JournalPartial(JournalBase):
         avatar_url: str = ""
         user_join_date: datetime = datetime.min
 
-    def __init__(self,  parserClass : Type[FAAPI_ABC], journal_tag: Optional[Record] = None):
+    def __init__(self,  parserClass : Type[FAAPI_ABC], journal_tag: Optional[Record] = None, *,
+                 author: Optional[UserPartial] = None):
         """
         :param journal_tag: The tag from which to parse the journal.
+        :param author: A shared author object, replaces the one parsed from the tag.
         """
         self.journal_tag: Optional[JournalPartial.Record] = journal_tag
 
@@ -133,6 +136,9 @@ class JournalPartial(JournalBase):
 
         self.parse()
 
+        if author is not None:
+            self.author = author
+
     def parse(self, journal_tag: Optional[Record] = None):
         """
         Parse a journal tag, overrides any information already present in the object.
@@ -165,7 +171,7 @@ class Journal(JournalBase):
     Contains complete journal information gathered from journal pages, including comments.
     """
 
-    @dataclass
+    @dataclass(slots=True)
     class Record:
         _: KW_ONLY
         id: int
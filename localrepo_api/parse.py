@@ -3,6 +3,15 @@
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 from htmlmin import minify  # type:ignore
+from html import escape
+from lxml.etree import Comment
+from lxml.etree import _Element
+from lxml.etree import strip_elements
+from lxml.etree import tostring
+from lxml.html import fragment_fromstring
+from os import environ
+from functools import lru_cache
+from dateutil.parser import parse as parse_date
 from datetime import datetime
 from re import MULTILINE
 from re import Match
@@ -10,25 +19,84 @@ from re import Pattern
 from re import compile as re_compile
 from re import match
 from re import search
-from re import sub
 from typing import Any
 from typing import Optional
 from typing import Union
 
+whitespace_pattern: Pattern = re_compile(r"[ \t\n\r\f]+")
+br_spaces_pattern: Pattern = re_compile(r" *(<br/?>) *")
+username_pattern: Pattern = re_compile(r"[^a-z\d.~`-]")
+# Whitespace is kept as written inside these, as htmlmin does
+verbatim_tags: tuple[str, ...] = ("pre", "textarea", "script", "style")
+
+
+class UsernameTable(dict):
+    """
+    Translation table deleting the characters matched by username_pattern, filled in as new characters are seen.
+    """
+
+    def __missing__(self, char: int) -> Optional[int]:
+        self[char] = value = None if username_pattern.match(chr(char)) else char
+        return value
+
+
+username_table: UsernameTable = UsernameTable()
+
 def parse_html_page(text: str) -> BeautifulSoup:
     return BeautifulSoup(text, "lxml")
 
+def normalize_username(username: str) -> str:
+    return username.lower().translate(username_table)
+
+@lru_cache(maxsize=1024)
+def parse_iso_date(date: str) -> datetime:
+    try:
+        return datetime.fromisoformat(date.replace("Z", "+00:00"))
+    except ValueError:
+        return parse_date(date)
+
 def bbcode_to_html(bbcode: str) -> str:
-    import faapi.furaffinity.furaffinity_parser
-    return faapi.furaffinity.furaffinity_parser.bbcode_to_html(bbcode)
+    # The converters live in the Fur Affinity parser, which imports this module, so they are imported on call.
+    from .furaffinity.furaffinity_parser import bbcode_to_html as fa_bbcode_to_html
+    return fa_bbcode_to_html(bbcode)
 
 def html_to_bbcode(html: str) -> str:
-    import faapi.furaffinity.furaffinity_parser
-    return faapi.furaffinity.furaffinity_parser.html_to_bbcode(html)
+    from .furaffinity.furaffinity_parser import html_to_bbcode as fa_html_to_bbcode
+    return fa_html_to_bbcode(html)
     
-def inner_html(tag: Tag) -> str:
-    return tag.decode_contents()
+def inner_html(tag: Union[Tag, _Element]) -> str:
+    if isinstance(tag, Tag):
+        return tag.decode_contents()
+    return escape(tag.text or "", quote=False) + \
+        "".join(tostring(child, method="html", encoding="unicode", with_tail=True) for child in tag)
+
+
+def force_htmlmin() -> bool:
+    return environ.get("FAAPI_FORCE_MINIFY", "") == "1"
+
+
+def minify_html(html: str, use_htmlmin: Optional[bool] = None) -> str:
+    if use_htmlmin is None:
+        use_htmlmin = force_htmlmin()
+    if use_htmlmin:
+        return minify(html, remove_comments=True, reduce_boolean_attributes=True)
+    root: _Element = fragment_fromstring(html, create_parent="div")
+    strip_elements(root, Comment, with_tail=False)
+    verbatim: set[_Element] = {e for tag in root.iter(*verbatim_tags) for e in tag.iter()}
+    for element in root.iter():
+        if element.text and element not in verbatim:
+            element.text = whitespace_pattern.sub(" ", element.text)
+        if element.tail and element.getparent() not in verbatim:
+            element.tail = whitespace_pattern.sub(" ", element.tail)
+    # lxml decodes &nbsp; into U+00A0, write it back as the entity htmlmin leaves in place
+    return inner_html(root).replace("\xa0", "&nbsp;")
+
+
+def clean_html(html: str, use_htmlmin: Optional[bool] = None) -> str:
+    return _clean_html(html, use_htmlmin if use_htmlmin is not None else force_htmlmin())
 
 
-def clean_html(html: str) -> str:
-    return sub(r" *(<br/?>) *", r"\1", minify(html, remove_comments=True, reduce_boolean_attributes=True)).strip()
+# The same descriptions and journal bodies show up again on listings and their own pages
+@lru_cache(maxsize=512)
+def _clean_html(html: str, use_htmlmin: bool) -> str:
+    return br_spaces_pattern.sub(r"\1", minify_html(html, use_htmlmin)).strip()
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from http.cookiejar import CookieJar
 from time import sleep
 from time import time
@@ -25,9 +25,11 @@ from ..exceptions import DisallowedPath, ParsingError
 from ..exceptions import Unauthorized
 from ..journal import Journal
 from ..journal import JournalPartial
-from .sofurry_parser import BeautifulSoup, parse_comment_tag, parse_comments, parse_journal_page, parse_journal_section, parse_submission_page, parse_user_page, parse_watchlist_page, username_url
+from .sofurry_parser import BeautifulSoup, parse_comment_tag, parse_journal_section, parse_user_page, parse_watchlist_page, username_url
 from .sofurry_parser import check_page_raise
 from .sofurry_parser import parse_loggedin_user
+from .sofurry_parser import parse_journal_and_comments
+from .sofurry_parser import parse_submission_and_comments
 from .sofurry_parser import parse_submission_figures
 from .sofurry_parser import parse_user_favorites
 from .sofurry_parser import parse_user_journals
@@ -36,16 +38,45 @@ from ..submission import Submission
 from ..submission import SubmissionPartial
 from ..user import User
 from ..user import UserPartial
+from ..user import epoch
 from . import sofurry_parser
 from ..exceptions import _raise_exception
 
+submission_types: dict[str, str] = {
+    "stories": "text",
+    "artwork": "image",
+    "photos": "image",
+    "music": "music"
+}
+
+# Comment fields SoFurry pages do not show, shared by every comment record
+comment_defaults: dict[str, Any] = {
+    "timestamp": epoch,
+    "user_title": "",
+    "edited": False,
+    "hidden": False,
+}
+
+# robots.txt is the same for every session, fetch it once per process
+sofurry_robots: dict[str, RobotFileParser] = {}
+
+def get_sofurry_robots(session: CloudflareScraper, root: str = "https://sofurry.com") -> RobotFileParser:
+    if (robots := sofurry_robots.get(root)) is None:
+        robots = sofurry_robots.setdefault(root, get_robots(session, root))
+    return robots
+
+@lru_cache(maxsize=4096)
+def user_host(user: str) -> str:
+    return f"//{username_url(user)}.sofurry.com"
+
+@lru_cache(maxsize=4096)
+def user_root(user: str) -> str:
+    return "https:" + user_host(user)
+
 def getSubmissionType(soFurrySubmissionType: str) -> str:
-    return {
-        "stories": "text",
-        "artwork": "image",
-        "photos": "image",
-        "music": "music"
-    }[soFurrySubmissionType]
+    return submission_types[soFurrySubmissionType]
+
+sofurry_root: str = "https://www.sofurry.com"
 
 def createUrlFromPage(page: str) -> Tuple[str, str]:
     # We identify a page of a multi-page response by the URL that is used to retrieve that page.
@@ -57,11 +88,13 @@ def createUrlFromPage(page: str) -> Tuple[str, str]:
     # Reconstructing the full URL here is annoying, but attempting to model the actual endpoint logic would be even *more* annoying.
 
     if page.startswith("//"):
-        rest = page[2:]
-        pathIndex = rest.index('/')
-        return ("https://" + rest[:pathIndex], rest[pathIndex:])
-    if page.startswith("/"):
-        return ("https://www.sofurry.com", page)
+        host, _, path = page[2:].partition("/")
+        return ("https://" + host, "/" + path)
+    return (sofurry_root, page)
+
+def page_location(page: Optional[str], user: str, folder: str) -> Tuple[str, str]:
+    # Paginated methods start from a folder of the user's subdomain and then follow the page URLs scraped from results
+    return createUrlFromPage(page) if page else (user_root(user), folder)
 
 
 class SoFurryFAAPI(FAAPI_BASE):
@@ -80,15 +113,13 @@ class SoFurryFAAPI(FAAPI_BASE):
         self.session: CloudflareScraper = make_session(cookies)  # Session used for get requests
         
         super().__init__(
-            robots = get_robots(self.session, "https://sofurry.com"),  # robots.txt handler
+            robots = get_sofurry_robots(self.session),  # robots.txt handler
             timeout = None,  # Timeout for requests
             raise_for_unauthorized = True  # Control login checks
         )
         
         self.last_get: float = time() - self.crawl_delay  # Time of last get (UNIX time)
         
-        
-    
     @property
     def login_status(self) -> bool:
         """
@@ -104,7 +135,10 @@ class SoFurryFAAPI(FAAPI_BASE):
 
         :return: A User object for the logged-in user, or None if the cookies are not from a login session.
         """
-        return self.user(user) if (user := parse_loggedin_user(self.get_parsed(""))) else None
+        user: Optional[str] = parse_loggedin_user(self.get_parsed("", skip_auth_check=True))
+        if user is None and self.raise_for_unauthorized:
+            raise Unauthorized("Not logged in")
+        return self.user(user) if user else None
 
     def frontpage(self) -> list[SubmissionPartial]:
         """
@@ -116,7 +150,10 @@ class SoFurryFAAPI(FAAPI_BASE):
         page_parsed: BeautifulSoup = self.get_parsed("/")
         submission_tags = parse_submission_figures(page_parsed)
         submissions: list[SubmissionPartial] = [SubmissionPartial(SoFurryFAAPI, SubmissionPartial.Record(**parse_submission_figure(f))) for f in submission_tags]
-        return sorted({s for s in submissions}, reverse=True)
+        unique_submissions: dict[int, SubmissionPartial] = {}
+        for submission in submissions:
+            unique_submissions.setdefault(submission.id, submission)
+        return [s for _, s in sorted(unique_submissions.items(), reverse=True)]
 
     def submission(self, submission_id: int, get_file: bool = False, *, chunk_size: Optional[int] = None
                    ) -> tuple[Submission, list[bytes]]:
@@ -129,7 +166,7 @@ class SoFurryFAAPI(FAAPI_BASE):
         :return: A Submission object and a bytes object (if the submission file is downloaded).
         """
         beautiful_soup = self.get_parsed(join_url("view", int(submission_id)))
-        parsed_submission = parse_submission_page(beautiful_soup)
+        parsed_submission, comment_tags = parse_submission_and_comments(beautiful_soup)
         fav_link = parsed_submission.pop('fav_link')
         unfav_link = parsed_submission.pop('unfav_link')
         parsed_submission['favorite_toggle_link'] = fav_link or unfav_link
@@ -140,12 +177,8 @@ class SoFurryFAAPI(FAAPI_BASE):
             species = "",
             gender = "",
             **parsed_submission))
-        comments = [Comment(SoFurryFAAPI, Comment.Record(
-            timestamp = datetime.fromtimestamp(0),
-            user_title = "",
-            edited = False,
-            hidden = False,
-            **parse_comment_tag(t)), sub) for t in parse_comments(beautiful_soup)]
+        comments = [Comment(SoFurryFAAPI, Comment.Record(**comment_defaults, **parse_comment_tag(t)), sub)
+                    for t in comment_tags]
         sub.comments = sort_comments(comments)
         sub_file: list[bytes] = self.submission_files(sub, chunk_size=chunk_size) if get_file and sub.id else []
         return sub, sub_file
@@ -160,21 +193,18 @@ class SoFurryFAAPI(FAAPI_BASE):
         url = join_url("view", int(journal_id))
         beautiful_soup = self.get_parsed(url)
         try:
+            parsed_journal, comment_tags = parse_journal_and_comments(beautiful_soup)
             parsed = Journal.Record(
                 user_status="",
                 user_title="",
-                user_join_date=datetime.fromtimestamp(0),
+                user_join_date=epoch,
                 header="",
                 footer="",
                 mentions=[],
-                **parse_journal_page(beautiful_soup))
+                **parsed_journal)
             journal = Journal(SoFurryFAAPI, parsed)
-            comments = [Comment(SoFurryFAAPI, Comment.Record(
-                timestamp=datetime.fromtimestamp(0),
-                user_title="",
-                edited=False,
-                hidden=False,
-                **parse_comment_tag(t)), journal) for t in parse_comments(beautiful_soup)]
+            comments = [Comment(SoFurryFAAPI, Comment.Record(**comment_defaults, **parse_comment_tag(t)), journal)
+                        for t in comment_tags]
         except ParsingError as e:
             _raise_exception(ParsingError(f"Error while parsing {url}", *e.args))
         journal.comments = sort_comments(comments)
@@ -187,7 +217,7 @@ class SoFurryFAAPI(FAAPI_BASE):
         :param user: The name of the user (_ characters are allowed).
         :return: A User object.
         """
-        beautifulSoup = self.get_parsed("", root=f"https://{username_url(user)}.sofurry.com/", adult=1)
+        beautifulSoup = self.get_parsed("", root=user_root(user), adult=1)
         parsed_user = parse_user_page(beautifulSoup)
         watch = parsed_user.pop("watch")
         unwatch = parsed_user.pop("unwatch")
@@ -224,12 +254,11 @@ class SoFurryFAAPI(FAAPI_BASE):
         """
         if page is None:
             # Return as subfolders the different submission types
-            sub_folders = [ (submission_type, f"//{username_url(user)}.sofurry.com/{submission_type}") for submission_type in ["stories", "artwork", "photos", "music"]]
+            sub_folders = [(submission_type, f"{user_host(user)}/{submission_type}") for submission_type in submission_types]
 
             return ([], None, sub_folders)
 
-        root, path = createUrlFromPage(page[1])
-        page_parsed: BeautifulSoup = self.get_parsed(path = path, root = root)
+        page_parsed: BeautifulSoup = self._get_parsed_page(page[1])
         info_parsed: dict[str, Any] = parse_user_submissions(page_parsed)
         author: UserPartial = UserPartial(SoFurryFAAPI)
         author.name, author.status, author.title, author.join_date, author.user_icon_url = [
@@ -237,9 +266,9 @@ class SoFurryFAAPI(FAAPI_BASE):
             info_parsed["user_title"], info_parsed["user_join_date"],
             info_parsed["user_icon_url"]
         ]
-        submissions = [SubmissionPartial(SoFurryFAAPI, SubmissionPartial.Record(type=getSubmissionType(page[0]), **figure)) for figure in info_parsed["figures"]]
-        for s in submissions:
-            s.author = author
+        submission_type: str = getSubmissionType(page[0])
+        submissions = [SubmissionPartial(SoFurryFAAPI, SubmissionPartial.Record(type=submission_type, **figure), author=author)
+                       for figure in info_parsed["figures"]]
 
         # Every results page will contain the subfolders, but we want to make sure that we only parse each subfolder once, on the first page
         # of each category.
@@ -273,14 +302,16 @@ class SoFurryFAAPI(FAAPI_BASE):
 
         if page is None:
             # Return as subfolders the different submission types
-            sub_folders = [ (submission_type, f"//{username_url(user)}.sofurry.com/favorites?type={submission_type}") for submission_type in ["stories", "artwork", "photos", "music"]]
+            sub_folders = [(submission_type, f"{user_host(user)}/favorites?type={submission_type}")
+                           for submission_type in submission_types]
 
             return ([], None, sub_folders)
 
-        root, path = createUrlFromPage(page[1])
-        page_parsed: BeautifulSoup = self.get_parsed(path = path, root = root)
+        page_parsed: BeautifulSoup = self._get_parsed_page(page[1])
         info_parsed: dict[str, Any] = parse_user_favorites(page_parsed)
-        submissions = [SubmissionPartial(SoFurryFAAPI, SubmissionPartial.Record(type=getSubmissionType(page[0]), **figure)) for figure in info_parsed["sections"]]
+        submission_type: str = getSubmissionType(page[0])
+        submissions = [SubmissionPartial(SoFurryFAAPI, SubmissionPartial.Record(type=submission_type, **figure))
+                       for figure in info_parsed["sections"]]
         return (submissions, (page[0], next_page) if (next_page := info_parsed["next_page"]) else None, [])
 
     def journals(self, user: str, page: Any = None) -> tuple[list[JournalPartial], Optional[Any], list[Any]]:
@@ -291,25 +322,24 @@ class SoFurryFAAPI(FAAPI_BASE):
         :param page: The page to fetch.
         :return: A list of Journal objects and the next page (None if it is the last).
         """
-        if page:
-            root, path = createUrlFromPage(page)
-        else:
-            root, path = f"https://{user}.sofurry.com", "journals"
-        page_parsed: BeautifulSoup = self.get_parsed(path = path, root = root)
+        page_parsed: BeautifulSoup = self._get_parsed_page(page, user, "journals")
         info_parsed: dict[str, Any] = parse_user_journals(page_parsed)
-        author: UserPartial = UserPartial(SoFurryFAAPI)
-        author.name, author.title, author.join_date, author.user_icon_url = [
-            info_parsed["user_name"],
-            info_parsed["user_title"], info_parsed["user_join_date"],
-            info_parsed["user_icon_url"]
-        ]
+        author: UserPartial = UserPartial(SoFurryFAAPI, UserPartial.Record(
+            name=info_parsed["user_name"],
+            status="",
+            title=info_parsed["user_title"],
+            join_date=info_parsed["user_join_date"],
+            avatar_url=info_parsed["user_icon_url"],
+        ))
         journals = [
-            JournalPartial(SoFurryFAAPI, parse_journal_section(tag))
+            JournalPartial(SoFurryFAAPI, parse_journal_section(tag), author=author)
                 for tag in info_parsed["sections"]]
-        for j in journals:
-            j.author = author
         return (journals, info_parsed["next_page"] or None, [])
 
+    def _get_parsed_page(self, page: Optional[str], user: str = "", folder: str = "") -> BeautifulSoup:
+        root, path = page_location(page, user, folder)
+        return self.get_parsed(path = path, root = root)
+
     def watchlist_to(self, user: str, page: Any = None) -> tuple[list[UserPartial], Optional[Any], list[Any]]:
         """
         Fetch a page from the list of users watching the user.
@@ -318,20 +348,7 @@ class SoFurryFAAPI(FAAPI_BASE):
         :param page: The page to fetch.
         :return: A list of UserPartial objects and the next page (None if it is the last).
         """
-        if page:
-            root, path = createUrlFromPage(page)
-        else:
-            root, path = f"https://{user}.sofurry.com", "watchers"
-        watchers_soup = self.get_parsed(path = path, root = root)
-        watchers = parse_watchlist_page(watchers_soup)
-           
-        users: list[UserPartial] = []
-        for user in watchers["users"]:
-            _user: UserPartial = UserPartial(SoFurryFAAPI)
-            _user.name = watchers["user_name"]
-            _user.user_icon_url = watchers["user_icon_url"]
-            users.append(_user)
-        return (users, watchers["next_page"], [])
+        return self._watchlist(user, "watchers", page)
 
     def watchlist_by(self, user: str, page: Any = None) -> tuple[list[UserPartial], Optional[Any], list[Any]]:
         """
@@ -340,19 +357,14 @@ class SoFurryFAAPI(FAAPI_BASE):
         :param page: The page to fetch.
         :return: A list of UserPartial objects and the next page (None if it is the last).
         """
-        if page:
-            root, path = createUrlFromPage(page)
-        else:
-            root, path = f"https://{user}.sofurry.com", "watching"
-        watchers_soup = self.get_parsed(path = path, root = root)
-        watchers = parse_watchlist_page(watchers_soup)
-           
-        users: list[UserPartial] = []
-        for user in watchers["users"]:
-            _user: UserPartial = UserPartial(SoFurryFAAPI)
-            _user.name = user["user_name"]
-            _user.user_icon_url = user["user_icon_url"]
-            users.append(_user)
+        return self._watchlist(user, "watching", page)
+
+    def _watchlist(self, user: str, folder: str, page: Any) -> tuple[list[UserPartial], Optional[Any], list[Any]]:
+        root, path = page_location(page, user, folder)
+        watchers = parse_watchlist_page(self.get_parsed(path, root = root))
+        users: list[UserPartial] = [
+            UserPartial.from_watchlist(SoFurryFAAPI, name, "", avatar_url=icon_url)
+            for name, icon_url in watchers["users"]]
         return (users, watchers["next_page"], [])
 
     def parse_loggedin_user(self, page: BeautifulSoup) -> Optional[str]:
@@ -363,7 +375,7 @@ class SoFurryFAAPI(FAAPI_BASE):
 
     @staticmethod
     def html_to_bbcode(html: str) -> str:
-        return html_to_bbcode(str)
+        return html_to_bbcode(html)
 
     @staticmethod
     def username_url(username: str) -> str:
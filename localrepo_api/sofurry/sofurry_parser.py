@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 from optparse import Option
 from re import MULTILINE
 from re import Match
@@ -6,8 +7,7 @@ from re import Pattern
 from re import compile as re_compile
 from re import match
 from re import search
-from re import sub
-import re
+from sys import intern
 from typing import Any, Tuple, TypeVar
 from typing import Optional
 from typing import Union
@@ -19,8 +19,11 @@ from bs4.element import NavigableString
 from bs4.element import Tag
 from dateutil.parser import parse as parse_date
 from htmlmin import minify
+from soupsieve import SoupSieve
+from soupsieve import compile as css_compile
 from localrepo_api.journal import JournalPartial # type:ignore
 
+from localrepo_api.parse import normalize_username
 from localrepo_api.parse import parse_html_page
 from localrepo_api.user import UserStats  
 
@@ -31,13 +34,28 @@ from ..exceptions import NotFound
 from ..exceptions import NoticeMessage
 from ..exceptions import ParsingError
 from ..exceptions import ServerError
-from ..exceptions import _raise_exception
 
 from localrepo_api.parse import clean_html, inner_html
 
 T = TypeVar('T') 
 
 root = "https://sofurry.com"
+folder_link_pattern: Pattern = re_compile(r"/browse/folder/stories\?by=(?P<uid>[^&]*)&folder=(?P<folderid>[^&]*)")
+posted_stat_pattern: Pattern = re_compile(r"Posted (.*)")
+views_stat_pattern: Pattern = re_compile(r"(\d+) views?")
+faves_stat_pattern: Pattern = re_compile(r"(\d+) faves?")
+comments_stat_pattern: Pattern = re_compile(r"(\d+) comments?")
+thumb_id_pattern: Pattern = re_compile(r"https://www.sofurryfiles.com/std/thumb\?page=(.*?)&ext=.*")
+comment_children_prefix: str = "sfCommentChildren"
+watchers_link_pattern: Pattern = re_compile(r"https://(?P<username>.*)\.sofurry\.com/watchers")
+watching_link_pattern: Pattern = re_compile(r"https://(?P<username>.*)\.sofurry\.com/watching")
+figure_id_pattern: Pattern = re_compile(r"\D*(\d+)")
+loggedin_user_find: dict[str, Pattern] = {"href": re_compile(r"https://(?P<username>.*?)\.sofurry\.com/")}
+artwork_figure_find: dict[str, Pattern] = {
+    "id": re_compile(r"sfArtwork(?P<id>\d+)"),
+    "alt": re_compile(r"(?P<title>.*)|by (?P<author>)"),
+    "src": re_compile(r"(?P<thumbnail_url>.*)"),
+}
 
 def getOnlyElement(l):
     if len(l) != 1:
@@ -52,86 +70,170 @@ def getOnlyElementOrNone(l):
     return l[0]
 
 def get(e: Optional[T], message: str) -> T:
-    assert e is not None, _raise_exception(ParsingError(f"Missing {message}"))
+    if e is None:
+        raise ParsingError(f"Missing {message}")
     return e
 
-def find(page: BeautifulSoup | Tag, regexe_exprs: dict[str, str], *args, **kwargs) -> Tuple[dict, Optional[Tag]]:
-    matches = {}
-    def generateMatcher(regex):
+def find(page: BeautifulSoup | Tag, patterns: dict[str, Pattern], *args, **kwargs) -> Tuple[dict, Optional[Tag]]:
+    matches: dict[str, Any] = {}
+    def generateMatcher(regex: Pattern):
+        regex_match = regex.match
         def matcher(e: Optional[str]) -> bool:
             if e is None:
                 return False
-            nonlocal matches
-            match = regex.match(e)
+            match = regex_match(e)
             if match:
-                matches |= match.groupdict()
+                matches.update(match.groupdict())
                 return True
-            matches = {}
+            matches.clear()
             return False
         return matcher
-    funcs = { key: generateMatcher(re.compile(regexe_exprs[key])) for key  in regexe_exprs }
+    funcs = { key: generateMatcher(pattern) for key, pattern in patterns.items() }
     foundTag = page.find(*args, **kwargs, **funcs)
     assert (foundTag is None) or isinstance(foundTag, Tag)
     return matches, foundTag    
 
+loggedin_avatar_selector: SoupSieve = css_compile("div.topbar-user a.avatar")
+
 def parse_loggedin_user(page: BeautifulSoup) -> Optional[str]:
-    a_tag = page.select_one("div.topbar-user a.avatar")
+    a_tag = loggedin_avatar_selector.select_one(page)
     if a_tag is None:
         return None
 
-    matches, tag = find(page, {"href" : "https://(?P<username>.*?)\\.sofurry\\.com/"}, "a")
+    matches, tag = find(page, loggedin_user_find, "a")
     return matches["username"]
 
+@lru_cache(maxsize=4096)
+def parse_sofurry_date(date: str) -> datetime:
+    # Pages repeat the same few dates (join dates, listing dates), and datetime objects are immutable
+    return parse_date(date)
+
+@lru_cache(maxsize=4096)
 def username_url(username: str) -> str:
-    return sub(r"[^a-z\d.~`-]", "", username.lower())
+    return normalize_username(username)
+
+author_name_selector: SoupSieve = css_compile("span.sf-username")
+author_icon_selector: SoupSieve = css_compile("img")
 
 def parse_user_small(author_tag: Tag) -> dict[str, Any]:
 
-    tag_author_name: Optional[Tag] = author_tag.select_one("span.sf-username")
-    tag_author_icon: Optional[Tag] = author_tag.select_one("img")
+    tag_author_name: Optional[Tag] = author_name_selector.select_one(author_tag)
+    tag_author_icon: Optional[Tag] = author_icon_selector.select_one(author_tag)
 
-    assert tag_author_name is not None, _raise_exception(ParsingError("Missing author name tag"))
-    assert tag_author_icon is not None, _raise_exception(ParsingError("Missing author icon tag"))
+    if tag_author_name is None:
+        raise ParsingError("Missing author name tag")
+    if tag_author_icon is None:
+        raise ParsingError("Missing author icon tag")
 
     author_name: str = tag_author_name.text.strip()
  
     author_icon_url: str = tag_author_icon.attrs["src"]
 
     return {
-        "user": author_name,
+        "user": intern(author_name),
         "user_icon_url": author_icon_url,
     }
 
-def getStats(page: BeautifulSoup):
-    statsHeader = page.find(class_="section-title", string="Stats")
-    assert isinstance(statsHeader, Tag), _raise_exception(ParsingError("Missing Stats Header"))
+submission_stat_patterns: dict[str, Pattern] = {
+    "posted": posted_stat_pattern,
+    "views": views_stat_pattern,
+    "faves": faves_stat_pattern,
+    "comments": comments_stat_pattern,
+}
+journal_stat_patterns: dict[str, Pattern] = {
+    "posted": posted_stat_pattern,
+    "comments": comments_stat_pattern,
+}
 
-    statsContent = statsHeader.find_next_sibling(class_="section-content")
-    assert isinstance(statsContent, Tag), _raise_exception(ParsingError("Missing Stats Content"))
-    stats = list(s.strip() for s in statsContent.strings)
-    def parseStats(regexp: str, match_group = 1) -> str:
-        reMatches = (re.search(regexp, stat) for stat in stats)
-        positiveMatches = (match for match in reMatches if match is not None)
-        # Get first non-None match, or throw an exception.
-        try:
-            reMatch = next(positiveMatches)
-            return reMatch[match_group]
-        except StopIteration:
-            _raise_exception(ParsingError(f"Missing Stat {regexp}"))
-        
-    
-    return parseStats
+section_title_selector: SoupSieve = css_compile(".section-title")
 
+def getStats(page: BeautifulSoup, patterns: dict[str, Pattern]) -> dict[str, str]:
+    statsHeader = next((tag for tag in section_title_selector.iselect(page) if tag.string == "Stats"), None)
+    if not isinstance(statsHeader, Tag):
+        raise ParsingError("Missing Stats Header")
+
+    statsContent = statsHeader.find_next_sibling(class_="section-content")
+    if not isinstance(statsContent, Tag):
+        raise ParsingError("Missing Stats Content")
+
+    # Scan the stats once, each pattern keeps the first line it matches and is dropped once found.
+    pending: dict[str, Pattern] = dict(patterns)
+    parsedStats: dict[str, str] = {}
+    for stat in statsContent.stripped_strings:
+        for key, regexp in list(pending.items()):
+            if reMatch := regexp.search(stat):
+                parsedStats[key] = reMatch[1]
+                del pending[key]
+        if not pending:
+            break
+    for regexp in pending.values():
+        raise ParsingError(f"Missing Stat {regexp.pattern}")
+
+    return parsedStats
+
+
+comment_outer_selector: SoupSieve = css_compile("div.sfCommentOuter")
+submission_tag_selector: SoupSieve = css_compile("[id*='sftagbox-']")
+folder_link_selector: SoupSieve = css_compile("a[href^='/browse/folder/stories?by='][href*='&folder=']")
+submission_page_selectors: tuple[SoupSieve, ...] = tuple(map(css_compile, (
+    "#sfPageId",
+    "[itemprop=image]",
+    "#sfContentTitle",
+    "#sf-userinfo-outer",
+    ".sf-username",
+    ".section-title-highlight",
+    folder_link_selector.pattern,
+    "#sfContentBody",
+    "#sfContentDescription",
+    "#sfFavorite_outer",
+    "#sfContentMusic",
+)))
+journal_page_selectors: tuple[SoupSieve, ...] = tuple(map(css_compile, (
+    "meta[name='og:image']",
+    "#sfContentTitle",
+    "#sfContentBody",
+)))
+
+def parse_folder_id(folder_link_tag: Optional[Tag]) -> Optional[str]:
+    folder_match = folder_link_pattern.match(folder_link_tag.attrs["href"]) if folder_link_tag else None
+    return folder_match["folderid"] if folder_match else None
+
+@lru_cache(maxsize=None)
+def combined_selector(patterns: tuple[str, ...]) -> SoupSieve:
+    return css_compile(", ".join(patterns))
+
+def select_page(page: Tag, selectors: tuple[SoupSieve, ...], *many: SoupSieve
+                ) -> tuple[list[Optional[Tag]], list[list[Tag]]]:
+    """
+    Walk the page once, collecting the first match of each of the selectors and every match of the many selectors.
+    """
+    first: list[Optional[Tag]] = [None] * len(selectors)
+    found: list[list[Tag]] = [[] for _ in many]
+    for tag in combined_selector(tuple(sel.pattern for sel in (*selectors, *many))).iselect(page):
+        for i, selector in enumerate(many):
+            if selector.match(tag):
+                found[i].append(tag)
+        for i, selector in enumerate(selectors):
+            if first[i] is None and selector.match(tag):
+                first[i] = tag
+    return first, found
 
 def parse_submission_page(sub_page: BeautifulSoup) -> dict[str, Any]:
+    return parse_submission_and_comments(sub_page)[0]
+
+def parse_submission_and_comments(sub_page: BeautifulSoup) -> tuple[dict[str, Any], list[Tag]]:
     # Rating is not viewable from a submission page itself.
-    [tag.unwrap() for tag in sub_page.find_all(name=["input", "form"])]
+    for tag in sub_page.find_all(name=("input", "form")):
+        tag.unwrap()
+
+    (idTag, imageTag, titleTag, authorTag, artistDisplayNameTag, seriesTitleTag, linkTag, contentBodyTag,
+     contentDescriptionTag, favoriteButtonTag, musicTag), (tagTags, commentTags) = select_page(
+        sub_page, submission_page_selectors, submission_tag_selector, comment_outer_selector)
 
-    idTag = sub_page.select_one('#sfPageId')
-    assert idTag is not None, _raise_exception(ParsingError("Missing ID"))
+    if idTag is None:
+        raise ParsingError("Missing ID")
     submitId = int(idTag.string.strip())
     
-    imageTag = sub_page.select_one("[itemprop=image]")
     assert imageTag is not None
     imageSrc: Optional[str] = imageTag.attrs["src"]
     isImage: bool = "preview" in imageSrc
@@ -140,54 +242,49 @@ def parse_submission_page(sub_page: BeautifulSoup) -> dict[str, Any]:
     if not hasImage:
         imageSrc = None
         
-    titleTag = sub_page.select_one("#sfContentTitle")
-    assert titleTag is not None, _raise_exception(ParsingError("Missing Title"))
+    if titleTag is None:
+        raise ParsingError("Missing Title")
     title = titleTag.string
 
-    authorTag = sub_page.select_one("#sf-userinfo-outer")
-    assert authorTag is not None, _raise_exception(ParsingError("Missing Artist"))
+    if authorTag is None:
+        raise ParsingError("Missing Artist")
 
-    tags: list[str] = [tag.string for tag in sub_page.find_all(id=re.compile("sftagbox-"))]
+    tags: list[str] = [intern(str(tag.string)) for tag in tagTags if tag.string]
 
-    artistDisplayNameTag = sub_page.select_one(".sf-username")
-    assert artistDisplayNameTag is not None, _raise_exception(ParsingError("Missing Artist Display Name"))
+    if artistDisplayNameTag is None:
+        raise ParsingError("Missing Artist Display Name")
     artistDisplayName = artistDisplayNameTag.string
 
-    artistUserNameTag = sub_page.select_one("#sf-userinfo-outer")
-    assert artistUserNameTag is not None, _raise_exception(ParsingError("Missing Artist User Name"))
-    artistUserName = artistUserNameTag.attrs["href"][8:-13]
+    artistUserName = authorTag.attrs["href"][8:-13]
 
-    seriesTitleTag = sub_page.select_one(".section-title-highlight")
     seriesTitle = seriesTitleTag and seriesTitleTag.string
     
-    parseStats = getStats(sub_page)
+    parsedStats = getStats(sub_page, submission_stat_patterns)
 
-    publishTimeStr = parseStats("Posted (.*)")
+    publishTimeStr = parsedStats["posted"]
 
-    publishTime: datetime = parse_date(publishTimeStr)
+    publishTime: datetime = parse_sofurry_date(publishTimeStr)
 
-    views = int(parseStats("(\\d+) views?"))
-    faves = int(parseStats("(\\d+) faves?"))
-    commentCount = int(parseStats("(\\d+) comments?"))
+    views = int(parsedStats["views"])
+    faves = int(parsedStats["faves"])
+    commentCount = int(parsedStats["comments"])
 
-    matches, linkTag = find(sub_page, {"href": "/browse/folder/stories\\?by=(?P<uid>.*?)&folder=(?P<folderid>.*?)"}, "a")
-    folderId = None if (linkTag is None) else matches.get("folderid")
+    folderId = parse_folder_id(linkTag)
 
-    descriptionTag = sub_page.select_one("#sfContentBody" if isImage else "#sfContentDescription")
+    descriptionTag = contentBodyTag if isImage else contentDescriptionTag
     
     description = clean_html(inner_html(descriptionTag)) if descriptionTag else ""
 
     file_url = f"https://www.sofurryfiles.com/std/content?page={submitId}"
 
-    unfaveButtonTag = sub_page.select_one("#sfFavorite_outer.yes")
-    unfaveLink = unfaveButtonTag.get("href") if unfaveButtonTag else None
-
-    faveButtonTag = None if unfaveButtonTag else sub_page.select_one("#sfFavorite_outer")
-    faveLink = faveButtonTag.get("href") if faveButtonTag else None
+    # The same button unfaves the submission when it is marked with the "yes" class
+    favorited: bool = favoriteButtonTag is not None and "yes" in favoriteButtonTag.get("class", [])
+    unfaveLink = favoriteButtonTag.get("href") if favoriteButtonTag and favorited else None
+    faveLink = favoriteButtonTag.get("href") if favoriteButtonTag and not favorited else None
 
     parsed_user = parse_user_small(authorTag)
 
-    category =  "music" if sub_page.select_one("#sfContentMusic") is not None else\
+    category =  "music" if musicTag is not None else\
                 "image" if isImage else\
                 "story"
 
@@ -214,34 +311,44 @@ def parse_submission_page(sub_page: BeautifulSoup) -> dict[str, Any]:
         "next": None,
         "fav_link": faveLink,
         "unfav_link": unfaveLink,
-    }
+    }, commentTags
 
 
 def parse_journal_page(journal_page: BeautifulSoup) -> dict[str, Any]:
-    tag_id: Optional[Tag] = journal_page.select_one("meta[name='og:image']")
-    tag_title: Optional[Tag] = journal_page.select_one("#sfContentTitle")
-    tag_content: Optional[Tag] = journal_page.select_one("#sfContentBody")
-
-    assert tag_id is not None, _raise_exception(ParsingError("Missing ID tag"))
-    assert tag_title is not None, _raise_exception(ParsingError("Missing title tag"))
-    assert tag_content is not None, _raise_exception(ParsingError("Missing content tag"))
+    return parse_journal_and_comments(journal_page)[0]
+
+def parse_journal_and_comments(journal_page: BeautifulSoup) -> tuple[dict[str, Any], list[Tag]]:
+    tag_id: Optional[Tag]
+    tag_title: Optional[Tag]
+    tag_content: Optional[Tag]
+    (tag_id, tag_title, tag_content), (comment_tags,) = select_page(
+        journal_page, journal_page_selectors, comment_outer_selector)
+
+    if tag_id is None:
+        raise ParsingError("Missing ID tag")
+    if tag_title is None:
+        raise ParsingError("Missing title tag")
+    if tag_content is None:
+        raise ParsingError("Missing content tag")
     
-    id_match = re.match("https://www.sofurryfiles.com/std/thumb\\?page=(.*?)&ext=.*", tag_id.attrs["content"])
-    assert id_match is not None, _raise_exception(ParsingError("Missing link tag"))
+    id_match = thumb_id_pattern.match(tag_id.attrs["content"])
+    if id_match is None:
+        raise ParsingError("Missing link tag")
     id_ = int(id_match[1])
     
     # noinspection DuplicatedCode
     title: str = tag_title.text.strip()
 
-    parseStats = getStats(journal_page)
+    parsedStats = getStats(journal_page, journal_stat_patterns)
 
-    publishTimeStr = parseStats("Posted (.*)")
-    publishTime: datetime = parse_date(publishTimeStr)
+    publishTimeStr = parsedStats["posted"]
+    publishTime: datetime = parse_sofurry_date(publishTimeStr)
     
     content: str = clean_html(inner_html(tag_content))
-    commentCount = int(parseStats("(\\d+) comments?"))
+    commentCount = int(parsedStats["comments"])
 
-    assert id_ != 0, _raise_exception(ParsingError("Missing ID"))
+    if id_ == 0:
+        raise ParsingError("Missing ID")
 
     user = parse_user_small(journal_page)
     user_name = user.pop("user")
@@ -253,84 +360,115 @@ def parse_journal_page(journal_page: BeautifulSoup) -> dict[str, Any]:
         "date": publishTime,
         "content": content,
         "comments": commentCount,
-    }
+    }, comment_tags
+
+comment_tag_selectors: tuple[SoupSieve, ...] = tuple(map(css_compile, (
+    "a",
+    "span.sf-comment-username a",
+    "img.sf-comments-avlarge",
+    "div.sfCommentBodyContent",
+)))
 
 def parse_comments(page: BeautifulSoup) -> list[Tag]:
-    return page.select("div.sfCommentOuter")
+    return comment_outer_selector.select(page)
 
 def parse_comment_tag(tag: Tag) -> dict:
-    tag_id: Optional[Tag] = tag.select_one("a")
-    tag_username: Optional[Tag] = tag.select_one("span.sf-comment-username a")
-    tag_user_icon: Optional[Tag] = tag.select_one("img.sf-comments-avlarge")
-    tag_body: Optional[Tag] = tag.select_one("div.sfCommentBodyContent")
+    tag_id: Optional[Tag]
+    tag_username: Optional[Tag]
+    tag_user_icon: Optional[Tag]
+    tag_body: Optional[Tag]
+    tag_id, tag_username, tag_user_icon, tag_body = (selector.select_one(tag) for selector in comment_tag_selectors)
 
-    assert tag_id is not None, _raise_exception(ParsingError("Missing link tag"))
-    assert tag_body is not None, _raise_exception(ParsingError("Missing body tag"))
+    if tag_id is None:
+        raise ParsingError("Missing link tag")
+    if tag_body is None:
+        raise ParsingError("Missing body tag")
 
     comment_id: Optional[str] = tag_id.attrs.get("name")
-    assert comment_id is not None, _raise_exception(ParsingError("Missing comment id"))
+    if comment_id is None:
+        raise ParsingError("Missing comment id")
 
     comment_text: str = clean_html(inner_html(tag_body))
 
-    assert tag_username is not None, _raise_exception(ParsingError("Missing user name tag"))
-    assert tag_user_icon is not None, _raise_exception(ParsingError("Missing user icon tag"))
+    if tag_username is None:
+        raise ParsingError("Missing user name tag")
+    if tag_user_icon is None:
+        raise ParsingError("Missing user icon tag")
 
     parent_id: Optional[int] = None
 
     parent_tag = tag.parent
     if parent_tag and (parent_class := parent_tag.attrs.get("class")) and parent_class == "sfCommentChildren":
-        id_match = re.match("sfCommentChildren(\\d+)", parent_tag.attrs["id"])
-        assert id_match is not None
-        parent_id = int(id_match[1])
+        parent_id_string: str = parent_tag.attrs["id"]
+        if not parent_id_string.startswith(comment_children_prefix):
+            raise ParsingError("Unexpected comment parent id")
+        parent_id = int(parent_id_string[len(comment_children_prefix):])
 
     attr_user_icon: Optional[str] = tag_user_icon.attrs.get("src")
 
-    assert attr_user_icon is not None, _raise_exception(ParsingError("Missing user icon src attribute"))
+    if attr_user_icon is None:
+        raise ParsingError("Missing user icon src attribute")
 
     return {
         "id": int(comment_id),
-        "user_name": tag_username.text.strip(),
+        "user_name": intern(tag_username.text.strip()),
         "user_icon_url": attr_user_icon,
         "text": comment_text,
         "parent": parent_id,
     }
 
+next_page_selector: SoupSieve = css_compile("li.next")
+previous_page_selector: SoupSieve = css_compile("li.previous")
+
 def parse_next_page(page: BeautifulSoup | Tag) -> Optional[str]:
-    next_page_tag = page.select_one("li.next")
+    next_page_tag = next_page_selector.select_one(page)
     if next_page_tag is None:
         return None
-    if "hidden" in next_page_tag.attrs["class"]:
+    if "hidden" in next_page_tag.get("class", ()):
         return None
-    return next_page_link.attrs["href"] if (next_page_link := next_page_tag.a) else None
+    next_page_link: Optional[Tag] = next_page_tag.a
+    href = next_page_link.get("href") if next_page_link else None
+    return href if isinstance(href, str) else None
+
+watchlist_user_selector: SoupSieve = css_compile("span.sf-item-h-info-content")
 
 def parse_watchlist_page(page: BeautifulSoup) -> dict[str, Any]:
-    user_tags = page.select("span.sf-item-h-info-content")
-    users = []
-    for user_tag in user_tags:
+    users: list[tuple[str, str]] = []
+    for user_tag in watchlist_user_selector.select(page):
         user_name = getOnlyElement(list(user_tag.stripped_strings))
-        user_icon_tag = get(user_tag.select_one("img"), "User Image")
-        user_icon_url = user_icon_tag.attrs["src"]
-        users.append({
-            "user_name": user_name,
-            "user_icon_url": user_icon_url
-        })
+        user_icon_tag = get(user_tag.img, "User Image")
+        users.append((user_name, user_icon_tag.attrs["src"]))
 
     return {
         "users": users,
-        "next_page": parse_next_page(page)
+        "next_page": parse_next_page(page),
     }
 
+thousands_separator_table: dict[int, Optional[int]] = str.maketrans("", "", ",")
+
+def to_int(x: str) -> int:
+    return int(x.translate(thousands_separator_table))
+
+# The stats table has no id or class, only this inline style sets it apart
+user_stats_selector: SoupSieve = css_compile('[style="display: table; white-space: nowrap; font-size: smaller;"]')
+contacts_selector: SoupSieve = css_compile("#sf-accounts")
+profile_selector: SoupSieve = css_compile("#sf-section-1 .sftc-content span span span")
+watch_form_selector: SoupSieve = css_compile("form[action^='/watch'], form[action^='/unwatch']")
+block_form_selector: SoupSieve = css_compile("form[action^='/block'], form[action^='/unblock']")
+
 def parse_user_page(user_page: BeautifulSoup) -> dict[str, Any]:
 
-    tag_profile: Optional[Tag] = user_page.select_one("#sf-section-1 .sftc-content span span span")
-    tag_stats: Optional[Tag] = user_page.select_one('[style="display: table; white-space: nowrap; font-size: smaller;"]')
-    tag_contacts: Optional[Tag] = user_page.select_one("#sf-accounts")
+    tag_profile: Optional[Tag] = profile_selector.select_one(user_page)
+    tag_stats: Optional[Tag] = user_stats_selector.select_one(user_page)
+    tag_contacts: Optional[Tag] = contacts_selector.select_one(user_page)
 
-    assert tag_stats is not None, _raise_exception(ParsingError("Missing stats tag"))
-    assert tag_profile is not None, _raise_exception(ParsingError("Missing profile tag"))
+    if tag_stats is None:
+        raise ParsingError("Missing stats tag")
+    if tag_profile is None:
+        raise ParsingError("Missing profile tag")
 
-    tag_watch: Optional[Tag] = user_page.select_one("form[action^='/watch'], form[action^='/unwatch']")
-    tag_block: Optional[Tag] = user_page.select_one("form[action^='/block'], form[action^='/unblock']")
+    tag_watch: Optional[Tag] = watch_form_selector.select_one(user_page)
+    tag_block: Optional[Tag] = block_form_selector.select_one(user_page)
 
 
     profile: str = clean_html(inner_html(tag_profile))
@@ -338,26 +476,27 @@ def parse_user_page(user_page: BeautifulSoup) -> dict[str, Any]:
     stats_scraped: dict[str, str] = {}
     info: dict[str, str] = {}
 
-    for stat_row_tag in tag_stats.findChildren("span", recursive = False):
-        category_tag = stat_row_tag.findChildren(class_ = "sfTextMedLight", recursive = False)[0]
+    for stat_row_tag in tag_stats.find_all("span", recursive = False):
+        # Each row is two cells, the sfTextMedLight one names the value in the other
+        cells: list[Tag] = stat_row_tag.find_all(recursive = False)
+        category_tag: Optional[Tag] = next((cell for cell in cells if "sfTextMedLight" in cell.get("class", ())), None)
+        if category_tag is None:
+            raise ParsingError("Missing stat name cell")
         if category_tag.text.strip() == "groups":
             continue
-        left_cell, right_cell = stat_row_tag.findChildren(recursive = False)
-        if category_tag == left_cell:
+        left_cell, right_cell = cells
+        if category_tag is left_cell:
             info[left_cell.text.strip()] = right_cell.text.strip()
         else: 
             stats_scraped[right_cell.text.strip()] = left_cell.text.strip() 
 
-    def to_int(x: str) -> int:
-        return int(x.replace(",", ""))
-
-    watchers_tag = user_page.find(class_="wide-inactive", href=re.compile("https://(?P<username>.*)\\.sofurry\\.com/watchers"))
+    watchers_tag = user_page.find(class_="wide-inactive", href=watchers_link_pattern)
     assert isinstance(watchers_tag, Tag)
     watchers_span = watchers_tag.span
     assert isinstance(watchers_span, Tag)
     watchers = to_int(watchers_span.text.strip()[1:-1])
 
-    watching_tag = user_page.find(class_="wide-inactive", href=re.compile("https://(?P<username>.*)\\.sofurry\\.com/watching"))
+    watching_tag = user_page.find(class_="wide-inactive", href=watching_link_pattern)
     assert isinstance(watching_tag, Tag)
     watching_span = watching_tag.span
     assert isinstance(watching_span, Tag)
@@ -405,25 +544,38 @@ def parse_user_page(user_page: BeautifulSoup) -> dict[str, Any]:
         "unblock": unblock,
     }
 
+user_big_selectors: tuple[SoupSieve, ...] = tuple(map(css_compile, (
+    ".user-text",
+    ".user .sfTextMedLight",
+    "span.user-stats strong",
+    ".user-info",
+)))
+
 def parse_user_big(user_tag: Tag) -> dict[str, Any]:
 
-    tag_username: Optional[Tag] = user_tag.select_one(".user-text")
-    tag_title: Optional[Tag] = user_tag.select_one(".user .sfTextMedLight")
-    tag_title_join_date: Optional[Tag] = user_tag.select_one("span.user-stats strong")
-    tag_user_icon_url: Optional[Tag] = user_tag.select_one(".user-info")
+    tag_username: Optional[Tag]
+    tag_title: Optional[Tag]
+    tag_title_join_date: Optional[Tag]
+    tag_user_icon_url: Optional[Tag]
+    (tag_username, tag_title, tag_title_join_date, tag_user_icon_url), _ = select_page(user_tag, user_big_selectors)
     
-    assert tag_username is not None, _raise_exception(ParsingError("Missing name tag"))
-    assert tag_title is not None, _raise_exception(ParsingError("Missing title tag"))
-    assert tag_title_join_date is not None, _raise_exception(ParsingError("Missing join date tag"))
-    assert tag_user_icon_url is not None, _raise_exception(ParsingError("Missing user icon URL tag"))
+    if tag_username is None:
+        raise ParsingError("Missing name tag")
+    if tag_title is None:
+        raise ParsingError("Missing title tag")
+    if tag_title_join_date is None:
+        raise ParsingError("Missing join date tag")
+    if tag_user_icon_url is None:
+        raise ParsingError("Missing user icon URL tag")
 
     user_icon_img_tag: Optional[Tag] = tag_user_icon_url.img
-    assert user_icon_img_tag is not None, _raise_exception(ParsingError("Missing user icon tag"))
+    if user_icon_img_tag is None:
+        raise ParsingError("Missing user icon tag")
     user_icon_url = user_icon_img_tag.attrs["src"]
 
     name: str = tag_username.text.strip()
     title: str = tag_title.text.strip()
-    join_date: datetime = parse_date(tag_title_join_date.text.strip())
+    join_date: datetime = parse_sofurry_date(tag_title_join_date.text.strip())
     
 
     return {
@@ -434,51 +586,65 @@ def parse_user_big(user_tag: Tag) -> dict[str, Any]:
     }
 
 
+artwork_figures_selector: SoupSieve = css_compile(".sfBrowseListContent .sfArtworkSmallWrapper")
+written_figures_selector: SoupSieve = css_compile(".sf-story, .sf-story-big")
+subfolders_selector: SoupSieve = css_compile(".sfBrowseListFolders .sfArtworkSmallWrapper")
+
+# In order of precedence, a figure is rated by the first of these classes it has
+figure_ratings: dict[str, str] = {
+    "sf-boxshadow-extreme": "extreme",
+    "sf-boxshadow-adult": "adult",
+    "sf-boxshadow-default": "general",
+}
+
+def parse_figure_rating(figure_tag: Tag) -> str:
+    classes: set[str] = set(figure_tag["class"])
+    rating: Optional[str] = next((rating for class_, rating in figure_ratings.items() if class_ in classes), None)
+    assert rating is not None
+    return rating
+
 def parse_artwork_figures(figures_page: BeautifulSoup) -> list[Tag]:
-    return figures_page.select(".sfBrowseListContent .sfArtworkSmallWrapper")
+    return artwork_figures_selector.select(figures_page)
 
 def parse_artwork_figure(figure: Tag) -> dict[str, Any]:
-    inner_tag = figure.select_one(".sfArtworkSmallInner")
-    data, imgTag = find(figure, { "id": "sfArtwork(?P<id>\\d+)", "alt": "(?P<title>.*)|by (?P<author>)", "src": "(?P<thumbnail_url>.*)" }, "img")
+    data, imgTag = find(figure, artwork_figure_find, "img")
     if not "title" in data:
         # TODO: Get the title of the submission by querying it directly.
         raise ParsingError(f"Artwork figure {data['id']} has no title. This is a known issue that can happen when the title contains a quote character.")
 
-    if "sf-boxshadow-extreme" in imgTag["class"]:
-        data["rating"] = "extreme"
-    elif "sf-boxshadow-adult" in imgTag["class"]:
-        data["rating"] = "adult"
-    else:
-        assert "sf-boxshadow-default" in imgTag["class"]
-        data["rating"] = "general"
+    data["rating"] = parse_figure_rating(imgTag)
     data["id"] = int(data["id"])
     return data
 
 def parse_written_figures(figures_page: BeautifulSoup) -> list[Tag]:
-    return figures_page.select(".sf-story, .sf-story-big")
+    return written_figures_selector.select(figures_page)
+
+story_big_title_selector: SoupSieve = css_compile(".sf-story-big-headline a")
+story_title_selector: SoupSieve = css_compile(".sf-story-headline a")
+story_big_icon_selector: SoupSieve = css_compile(".sf-story-big-avatar img")
+story_icon_selector: SoupSieve = css_compile(".sf-story-avatar img")
+story_author_selector: SoupSieve = css_compile(".sfTextAttention")
 
 def parse_written_figure(figure: Tag) -> dict[str, Any]:
-    title_tag = figure.select_one(".sf-story-big-headline a") or figure.select_one(".sf-story-headline a")
-    assert title_tag is not None, _raise_exception(ParsingError("Title not found"))
+    title_tag = story_big_title_selector.select_one(figure) or story_title_selector.select_one(figure)
+    if title_tag is None:
+        raise ParsingError("Title not found")
     title = title_tag.attrs["href"]
     id_string = figure.attrs["id"]
-    id_match = re.match("\\D*(\\d+)", id_string)
-    assert id_match is not None, _raise_exception(ParsingError("Figure id not found"))
+    id_match = figure_id_pattern.match(id_string)
+    if id_match is None:
+        raise ParsingError("Figure id not found")
     id_ = id_match[1]
 
-    author_tag = figure.select_one(".sfTextAttention")
-    assert author_tag is not None, _raise_exception(ParsingError("Author tag not found"))
+    author_tag = story_author_selector.select_one(figure)
+    if author_tag is None:
+        raise ParsingError("Author tag not found")
 
-    icon_tag = title_tag = figure.select_one(".sf-story-big-avatar img") or figure.select_one(".sf-story-avatar img")
-    assert icon_tag is not None, _raise_exception(ParsingError("Story icon not found"))
+    icon_tag = title_tag = story_big_icon_selector.select_one(figure) or story_icon_selector.select_one(figure)
+    if icon_tag is None:
+        raise ParsingError("Story icon not found")
 
-    rating = "general"
-    if "sf-boxshadow-extreme" in icon_tag["class"]:
-        rating = "extreme"
-    elif "sf-boxshadow-adult" in icon_tag["class"]:
-        rating = "adult"
-    else:
-        assert "sf-boxshadow-default" in icon_tag["class"]
+    rating = parse_figure_rating(icon_tag)
 
     return {
         "id": int(id_),
@@ -489,8 +655,11 @@ def parse_written_figure(figure: Tag) -> dict[str, Any]:
     }
 
 def parse_submission_figures(page: BeautifulSoup) -> list[dict[str, Any]]:
-    return ([parse_written_figure(f) for f in parse_written_figures(page)] +
-        [parse_artwork_figure(f) for f in parse_artwork_figures(page)])
+    # One walk collects both kinds of figures, written ones are still listed first
+    written_figures: list[Tag]
+    artwork_figures: list[Tag]
+    _, (artwork_figures, written_figures) = select_page(page, (), artwork_figures_selector, written_figures_selector)
+    return [*map(parse_written_figure, written_figures), *map(parse_artwork_figure, artwork_figures)]
 
 
 def parse_subfolder(subfolder: Tag) -> dict[str, Any]:
@@ -501,14 +670,14 @@ def parse_subfolder(subfolder: Tag) -> dict[str, Any]:
     }
 
 def parse_subfolders(page: BeautifulSoup) -> dict[str, Any]:
-    subfolders = page.select(".sfBrowseListFolders .sfArtworkSmallWrapper")
+    subfolders = subfolders_selector.select(page)
     return {
-        "subfolders": [parse_subfolder(subfolder) for subfolder in subfolders]
+        "subfolders": list(map(parse_subfolder, subfolders))
     }
 
 def parse_user_submissions(submissions_page: BeautifulSoup) -> dict[str, Any]:
-    last_page = not any(submissions_page.select("li.next"))
-    first_page = not any(submissions_page.select("li.previous"))
+    last_page = next_page_selector.select_one(submissions_page) is None
+    first_page = previous_page_selector.select_one(submissions_page) is None
 
     return {
         **parse_user_big(submissions_page),
@@ -519,20 +688,25 @@ def parse_user_submissions(submissions_page: BeautifulSoup) -> dict[str, Any]:
         "next_page": parse_next_page(submissions_page)
     }
 
+story_abbr_selector: SoupSieve = css_compile("abbr")
+story_date_selector: SoupSieve = css_compile(".sf-story-big-metadata strong span")
+story_content_selector: SoupSieve = css_compile(".sf-story-big-content")
+
 def parse_journal_section(section_tag: Tag) -> JournalPartial.Record:
     # journals on the journals page are formatted the same as written submissions
     data = parse_written_figure(section_tag)
-    date_tag = section_tag.select_one("abbr")
+    date_tag = story_abbr_selector.select_one(section_tag)
 
     if date_tag is None:
-        date_tag = section_tag.select_one(".sf-story-big-metadata strong span")
-        date = parse_date(date_tag.string)
+        date_tag = story_date_selector.select_one(section_tag)
+        date = parse_sofurry_date(str(date_tag.string))
     else:
-        date = parse_date(date_tag.attrs["title"])
+        date = parse_sofurry_date(date_tag.attrs["title"])
     # Only the first journal on each page has a preview.
-    content_tag = section_tag.select_one(".sf-story-big-content")
+    content_tag = story_content_selector.select_one(section_tag)
 
-    assert date_tag is not None, _raise_exception(ParsingError("Missing date tag"))
+    if date_tag is None:
+        raise ParsingError("Missing date tag")
 
     content = "" if content_tag is None else clean_html(inner_html(content_tag))
 
@@ -558,7 +732,7 @@ def parse_user_favorites(favorites_page: BeautifulSoup) -> dict[str, Any]:
 def parse_user_journals(journals_page: BeautifulSoup) -> dict[str, Any]:
     return {
         **parse_user_big(journals_page),
-        "sections": journals_page.select(".sf-story, .sf-story-big"),
+        "sections": written_figures_selector.select(journals_page),
         "next_page": parse_next_page(journals_page)
     }
 
@@ -10,6 +10,7 @@ from .exceptions import _raise_exception
 from bs4 import BeautifulSoup
 from bs4 import Tag
 from .user import UserPartial
+from .user import epoch
 
 
 class SubmissionStats(namedtuple("SubmissionStats", ["views", "comments", "favorites"])):
@@ -38,7 +39,8 @@ class SubmissionBase:
     def __init__(self, parserClass: Type[FAAPI_ABC]):
         self.id: int = 0
         self.title: str = ""
-        self.author: UserPartial = UserPartial(parserClass)
+        self._author: Optional[UserPartial] = None
+        self._author_name: str = ""
         self.parserClass = parserClass
 
     def __hash__(self) -> int:
@@ -90,6 +92,22 @@ class SubmissionBase:
     def __str__(self):
         return f"{self.id} {self.author} {self.title}"
 
+    @property
+    def author(self) -> UserPartial:
+        """
+        The submission's author, created on first access.
+
+        :return: The author of the submission.
+        """
+        if self._author is None:
+            self._author = UserPartial(self.parserClass)
+            self._author.name = self._author_name
+        return self._author
+
+    @author.setter
+    def author(self, author: UserPartial):
+        self._author = author
+
     @property
     def url(self):
         """
@@ -105,7 +123,7 @@ class SubmissionPartial(SubmissionBase):
     Contains partial submission information gathered from submissions pages (gallery, scraps, etc.).
     """
 
-    @dataclass
+    @dataclass(slots=True)
     class Record:
         _: KW_ONLY
         id: int
@@ -115,9 +133,11 @@ class SubmissionPartial(SubmissionBase):
         thumbnail_url: str
         author: str = ""
 
-    def __init__(self, parserClass: Type[FAAPI_ABC], submission_figure: Optional[Record] = None):
+    def __init__(self, parserClass: Type[FAAPI_ABC], submission_figure: Optional[Record] = None, *,
+                 author: Optional[UserPartial] = None):
         """
         :param submission_figure: The figure tag from which to parse the submission information.
+        :param author: An optional author shared with other submissions, used instead of the record's author name.
         """
 
         super().__init__(parserClass)
@@ -128,6 +148,8 @@ class SubmissionPartial(SubmissionBase):
         self.thumbnail_url: str = ""
 
         self.parse()
+        if author is not None:
+            self._author = author
 
     def __iter__(self):
         yield "id", self.id
@@ -152,7 +174,7 @@ class SubmissionPartial(SubmissionBase):
 
         self.id = self.submission_figure.id
         self.title = self.submission_figure.title
-        self.author.name = self.submission_figure.author
+        self._author, self._author_name = None, self.submission_figure.author
         self.rating = self.submission_figure.rating
         self.type = self.submission_figure.type
         self.thumbnail_url = self.submission_figure.thumbnail_url
@@ -163,7 +185,7 @@ class Submission(SubmissionBase):
     Contains complete submission information gathered from submission pages, including comments.
     """
 
-    @dataclass
+    @dataclass(slots=True)
     class Record:
         _: KW_ONLY
         id: int
@@ -202,7 +224,7 @@ class Submission(SubmissionBase):
         super().__init__(parserClass)
 
         self.submission_page: Optional[Submission.Record] = submission_page
-        self.date: datetime = datetime.fromtimestamp(0)
+        self.date: datetime = epoch
         self.tags: list[str] = []
         self.category: str = ""
         self.species: str = ""
@@ -223,6 +245,7 @@ class Submission(SubmissionBase):
         self.favorite_toggle_link: str = ""
         from .comment import Comment
         self.comments: list[Comment] = []
+        self._bbcode: dict[str, str] = {}
 
         self.parse()
 
@@ -259,7 +282,7 @@ class Submission(SubmissionBase):
 
         :return: BBCode description
         """
-        return self.parserClass.html_to_bbcode(self.description)
+        return self._html_to_bbcode(self.description)
 
     @property
     def footer_bbcode(self) -> str:
@@ -268,7 +291,12 @@ class Submission(SubmissionBase):
 
         :return: BBCode footer
         """
-        return self.parserClass.html_to_bbcode(self.footer)
+        return self._html_to_bbcode(self.footer)
+
+    def _html_to_bbcode(self, html: str) -> str:
+        if (bbcode := self._bbcode.get(html)) is None:
+            bbcode = self._bbcode[html] = self.parserClass.html_to_bbcode(html)
+        return bbcode
 
     def parse(self, submission_page: Optional[Record] = None):
         """
@@ -1,9 +1,15 @@
 from collections import namedtuple
-from dataclasses import KW_ONLY, dataclass
+from dataclasses import dataclass
+from datetime import date
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from sys import intern
 from typing import Optional, Type
 from urllib.parse import quote
 
+from dateutil.tz import tzutc
+
 from localrepo_api.interface.faapi_abc import FAAPI_ABC
 
 from .connection import join_url
@@ -12,6 +18,19 @@ from bs4 import BeautifulSoup
 from bs4 import Tag
 
 
+epoch: datetime = datetime.fromtimestamp(0)
+epoch_utc: datetime = datetime.fromtimestamp(0, tz = tzutc())
+
+
+def intern_short(value: str) -> str:
+    return intern(value) if len(value) < 64 else value
+
+
+@lru_cache(maxsize=1)
+def format_avatar_date(day: date) -> str:
+    return f"{day:%Y%m%d}"
+
+
 class UserStats(namedtuple("UserStats", ["views", "submissions", "favorites", "comments_earned",
                                          "comments_made", "journals", "watched_by", "watching"])):
     """
@@ -26,14 +45,20 @@ class UserStats(namedtuple("UserStats", ["views", "submissions", "favorites", "c
     * watching
     """
 
+    __slots__ = ()
+
 
 class UserBase:
     """
     Base class for the user objects.
     """
 
+    _iter_fields: tuple[str, ...] = ("name", "status")
+    _iter_getter: attrgetter = attrgetter(*_iter_fields)
+
     def __init__(self, parserClass: Type[FAAPI_ABC]):
-        self.name: str = ""
+        self._name: str = ""
+        self._name_url: Optional[str] = None
         self.status: str = ""
         self.parserClass = parserClass
 
@@ -76,8 +101,7 @@ class UserBase:
         return False
 
     def __iter__(self):
-        yield "name", self.name
-        yield "status", self.status
+        return zip(self._iter_fields, self._iter_getter(self))
 
     def __repr__(self):
         return self.__str__()
@@ -86,13 +110,23 @@ class UserBase:
         return str(self.status) + str(self.name)
 
     @property
-    def name_url(self):
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name, self._name_url = name, None
+
+    @property
+    def name_url(self) -> str:
         """
-        Compose the URL-safe username.
+        Compose the URL-safe username, cached until the name changes.
 
         :return: The cleaned username.
         """
-        return self.parserClass.username_url(self.name)
+        if self._name_url is None:
+            self._name_url = self.parserClass.username_url(self._name)
+        return self._name_url
 
     @property
     def url(self):
@@ -109,7 +143,7 @@ class UserBase:
 
         :return: The URL to the user icon
         """
-        return f"https://a.furaffinity.net/{datetime.now():%Y%m%d}/{self.name_url}.gif"
+        return f"https://a.furaffinity.net/{format_avatar_date(date.today())}/{self.name_url}.gif"
 
 
 class UserPartial(UserBase):
@@ -117,15 +151,17 @@ class UserPartial(UserBase):
     Contains partial user information gathered from user folders (gallery, journals, etc.) and submission/journal pages.
     """
 
-    @dataclass
+    @dataclass(slots=True, kw_only=True)
     class Record:
-        _: KW_ONLY
         name: str
         status: str
         title: str
         join_date: datetime
         avatar_url: str
 
+    _iter_fields: tuple[str, ...] = ("name", "status", "title", "join_date", "avatar_url")
+    _iter_getter: attrgetter = attrgetter(*_iter_fields)
+
     def __init__(self, parserClass : Type[FAAPI_ABC], user_tag: Optional[Record] = None):
         """
         :param user_tag: The tag from which to parse the user information.
@@ -134,18 +170,33 @@ class UserPartial(UserBase):
         super().__init__(parserClass)
 
         self.user_tag: Optional[UserPartial.Record] = user_tag
+        if user_tag is not None:
+            self.parse()
+            return
+
         self.title: str = ""
-        self.join_date: datetime = datetime.fromtimestamp(0)
+        self.join_date: datetime = epoch
         self.avatar_url: str = ""
 
-        self.parse()
+    @classmethod
+    def from_watchlist(cls, parserClass: Type[FAAPI_ABC], name: str, status: str, avatar_url: str = "") -> "UserPartial":
+        """
+        Build a user from a watchlist row without going through the full constructor.
 
-    def __iter__(self):
-        yield "name", self.name
-        yield "status", self.status
-        yield "title", self.title
-        yield "join_date", self.join_date
-        yield "avatar_url", self.avatar_url
+        :param name: The name of the user.
+        :param status: The status character of the user.
+        :param avatar_url: The URL to the user icon, if the row has one.
+        :return: The UserPartial object.
+        """
+        user: UserPartial = cls.__new__(cls)
+        user.parserClass = parserClass
+        user._name, user._name_url = intern_short(name), None
+        user.status = intern_short(status)
+        user.user_tag = None
+        user.title = ""
+        user.join_date = epoch
+        user.avatar_url = avatar_url
+        return user
 
     def parse(self, user_tag: Optional[Record] = None):
         """
@@ -160,9 +211,9 @@ class UserPartial(UserBase):
 
         # parsed: dict = self.parserClass.parser().parse_user_tag(self.user_tag)
 
-        self.name = self.user_tag.name
-        self.status = self.user_tag.status
-        self.title = self.user_tag.title
+        self.name = intern_short(self.user_tag.name)
+        self.status = intern_short(self.user_tag.status)
+        self.title = intern_short(self.user_tag.title)
         self.join_date = self.user_tag.join_date
         self.avatar_url = self.user_tag.avatar_url
 
@@ -171,9 +222,8 @@ class User(UserBase):
     Contains complete user information gathered from userpages.
     """
 
-    @dataclass
+    @dataclass(slots=True, kw_only=True)
     class Record:
-        _: KW_ONLY
         name: str
         status: str
         profile: str
@@ -189,6 +239,11 @@ class User(UserBase):
         blocked: bool
         blocked_toggle_link: Optional[str]
 
+    _iter_fields: tuple[str, ...] = ("name", "status", "title", "join_date", "profile", "stats", "info", "contacts",
+                                     "avatar_url", "banner_url", "watched", "watched_toggle_link", "blocked",
+                                     "blocked_toggle_link")
+    _iter_getter: attrgetter = attrgetter(*_iter_fields)
+
     def __init__(self, parserClass : Type[FAAPI_ABC], user_page: Optional[Record] = None):
         """
         :param user_page: The page from which to parse the user information.
@@ -196,8 +251,12 @@ class User(UserBase):
 
         super().__init__(parserClass)
         self.user_page: Optional[User.Record] = user_page
+        if user_page is not None:
+            self.parse()
+            return
+
         self.title: str = ""
-        self.join_date: datetime = datetime.fromtimestamp(0)
+        self.join_date: datetime = epoch
         self.profile: str = ""
         self.stats: UserStats = UserStats(0, 0, 0, 0, 0, 0, 0, 0)
         self.info: dict[str, str] = {}
@@ -209,23 +268,9 @@ class User(UserBase):
         self.blocked: bool = False
         self.blocked_toggle_link: Optional[str] = None
 
-        self.parse()
-
     def __iter__(self):
-        yield "name", self.name
-        yield "status", self.status
-        yield "title", self.title
-        yield "join_date", self.join_date
-        yield "profile", self.profile
-        yield "stats", self.stats._asdict()
-        yield "info", self.info
-        yield "contacts", self.contacts
-        yield "avatar_url", self.avatar_url
-        yield "banner_url", self.banner_url
-        yield "watched", self.watched
-        yield "watched_toggle_link", self.watched_toggle_link
-        yield "blocked", self.blocked
-        yield "blocked_toggle_link", self.blocked_toggle_link
+        for name, value in zip(self._iter_fields, self._iter_getter(self)):
+            yield name, value._asdict() if name == "stats" else value
 
     @property
     def profile_bbcode(self) -> str:
@@ -248,15 +293,16 @@ class User(UserBase):
 
         # parsed: dict = self.parserClass.parser().parse_user_page(self.user_page)
 
-        self.name = self.user_page.name
-        self.status = self.user_page.status
+        self.name = intern_short(self.user_page.name)
+        self.status = intern_short(self.user_page.status)
         self.profile = self.user_page.profile
-        self.title = self.user_page.title
+        self.title = intern_short(self.user_page.title)
         self.join_date = self.user_page.join_date
-        self.stats = UserStats(*self.user_page.stats)
+        self.stats = self.user_page.stats
         self.info = self.user_page.info
         self.contacts = self.user_page.contacts
         self.avatar_url = self.user_page.avatar_url
+        self.banner_url = self.user_page.banner_url
         self.watched = self.user_page.watched
         self.watched_toggle_link = self.user_page.watched_toggle_link
         self.blocked = self.user_page.blocked
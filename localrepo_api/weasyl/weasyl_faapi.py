@@ -1,8 +1,7 @@
 from datetime import datetime, timezone
 import functools
+from operator import itemgetter
 from http.cookiejar import CookieJar
-import re
-from re import sub
 from time import sleep
 from time import time
 from typing import Any, Dict, List, Tuple, Type
@@ -10,8 +9,9 @@ from typing import Optional
 from typing import Union
 from urllib.robotparser import RobotFileParser
 from bs4 import BeautifulSoup
-from dateutil.parser import parse as parse_date
-from dateutil.tz import tzutc
+from bs4 import Tag
+from soupsieve import SoupSieve
+from soupsieve import compile as css_compile
 
 from localrepo_api.base import FAAPI_BASE
 
@@ -19,7 +19,10 @@ from ..connection import CloudflareScraper
 from ..connection import CookieDict
 from ..connection import Response
 from ..connection import get_robots
+from ..connection import load_json
 from ..connection import make_session
+from ..parse import normalize_username
+from ..parse import parse_iso_date
 from ..exceptions import DisallowedPath, NonePage, ParsingError
 from ..exceptions import Unauthorized
 from ..journal import Journal, JournalStats
@@ -28,30 +31,62 @@ from ..submission import Submission, SubmissionUserFolder
 from ..submission import SubmissionPartial
 from ..user import User, UserStats
 from ..user import UserPartial
+from ..user import epoch_utc
 from . import weasyl_parser
 
-from .weasyl_parser import parse_submission_figure, parse_user_favorites, parse_user_folder
-
-def convertRating(rating: str) -> str:
-    match rating:
-        case "general":
-            return "General"
-        case "mature":
-            return "Mature"
-        case "explicit":
-            return "Explicit"
+from .weasyl_parser import parse_submission_figure, parse_user_favorites, parse_user_folder, parse_watchlist_page
+
+root: str = "https://www.weasyl.com/"
+journal_list_selector: SoupSieve = css_compile(".text-post-group-header, .text-post-item")
+journal_title_selector: SoupSieve = css_compile(".text-post-title")
+journal_excerpt_selector: SoupSieve = css_compile(".text-post-excerpt")
+
+ratings: dict[str, str] = {
+    "general": "General",
+    "mature": "Mature",
+    "explicit": "Explicit",
+}
+
+extension_types: dict[str, str] = {
+    "jpg": "image",
+    "gif": "image",
+    "png": "image",
+    "swf": "flash",
+    "txt": "text",
+    "md": "text",
+    "pdf": "text",
+    "mp3": "music",
+}
 
 def computeTypeFromExtension(extension: str, submitid: int) -> str:
-    match extension:
-        case "jpg" | "gif" | "png":
-            return "image"
-        case "swf":
-            return "flash"
-        case "txt" | "md" | "pdf":
-            return "text"
-        case "mp3":
-            return "music"
-    raise Exception(f"Unknown file extension {extension} on submission {submitid}")
+    try:
+        return extension_types[extension]
+    except KeyError:
+        raise Exception(f"Unknown file extension {extension} on submission {submitid}")
+
+submission_json_fields: itemgetter = itemgetter("submitid", "title", "rating", "media")
+submission_json_renames: tuple[tuple[str, str], ...] = (
+    ("submitid", "id"),
+    ("title", "title"),
+    ("owner", "author"),
+    ("tags", "tags"),
+    ("views", "views"),
+    ("comments", "comment_count"),
+    ("favorites", "favorites"),
+    ("description", "description"),
+    ("favorited", "favorite"),
+)
+
+def parse_submission_json(submission: dict[str, Any], author: str = "") -> SubmissionPartial.Record:
+    id_, title, rating, media = submission_json_fields(submission)
+    thumbnail_url: str = media["thumbnail"][0]["url"]
+    return SubmissionPartial.Record(
+        id = id_,
+        title = title,
+        author = author,
+        rating = ratings[rating],
+        type = computeTypeFromExtension(thumbnail_url.rpartition(".")[2], id_),
+        thumbnail_url = thumbnail_url)
 
 
 class WeasylFAAPI(FAAPI_BASE):
@@ -60,7 +95,7 @@ class WeasylFAAPI(FAAPI_BASE):
     """
     @staticmethod
     def root() -> str:
-        return "https://www.weasyl.com/"
+        return root
 
     def __init__(self, cookies: Union[list[CookieDict], CookieJar]):
         """
@@ -81,20 +116,21 @@ class WeasylFAAPI(FAAPI_BASE):
                    **params: Union[str, bytes, int, float]) -> Any:
         """
         Fetch a path with a GET request and parse it as JSON.
+        The body is decoded with orjson when it is installed, with the standard json module otherwise.
 
         :param path: The path to fetch.
-        :param skip_page_check: Whether to skip checking the parsed page for errors.
-        :param skip_auth_check: Whether to skip checking the parsed page for login status.
+        :param skip_auth_check: Whether to skip checking the response for login status.
         :param params: Query parameters for the request.
-        :return: A BeautifulSoup object containing the parsed content of the request response.
+        :return: The decoded JSON content of the request response.
         """
         response: Response = self.get(path, **params)
-        if not skip_auth_check and self.raise_for_unauthorized and response.status_code == 401:
-            raise Unauthorized("Not logged in")
-        if response.status_code != 401:
+        if response.status_code == 401:
+            if not skip_auth_check and self.raise_for_unauthorized:
+                raise Unauthorized("Not logged in")
+        else:
             response.raise_for_status()
 
-        return response.json()
+        return load_json(response)
     
     def get_loggedin_user(self, endpoint: str = "/api/whoami", **kwargs) -> Optional[str]:
         json = self.get_json(endpoint, **kwargs)
@@ -128,20 +164,13 @@ class WeasylFAAPI(FAAPI_BASE):
         :return: A list of SubmissionPartial objects
         """
         frontpage_submissions = self.get_json("/api/submissions/frontpage")
-        if type(frontpage_submissions) is not list:
+        if not isinstance(frontpage_submissions, list):
             raise ParsingError("Unable to parse front page submissions")
 
         # The front page can be a mix of submissions and characters. Characters have a different format and are not currently supported, so they get ignored.
-        submissions: list[SubmissionPartial] = [
-            SubmissionPartial(WeasylFAAPI, SubmissionPartial.Record(
-                id = f["submitid"],
-                title = f["title"],
-                author = f["owner"],
-                rating = convertRating(f["rating"]),
-                type = computeTypeFromExtension(f["media"]["thumbnail"][0]["url"].split(".")[-1], f["submitid"]),
-                thumbnail_url = f["media"]["thumbnail"][0]["url"]))
-            for f in frontpage_submissions if f["type"] == "submission"]
-        return sorted({s for s in submissions}, reverse=True)
+        unique_submissions: dict[int, Any] = {f["submitid"]: f for f in frontpage_submissions if f["type"] == "submission"}
+        return [SubmissionPartial(WeasylFAAPI, parse_submission_json(f, f["owner"]))
+                for _, f in sorted(unique_submissions.items(), reverse=True)]
 
     def submission(self, submission_id: int, get_file: bool = False, *, chunk_size: Optional[int] = None
                    ) -> tuple[Submission, list[bytes]]:
@@ -155,39 +184,32 @@ class WeasylFAAPI(FAAPI_BASE):
         """
         response: Any = self.get_json(f"/api/submissions/{submission_id}/view")
         assert response["submitid"] == submission_id
+        file_url: str = response["media"]["submission"][0]["url"]
         sub: Submission = Submission(
             WeasylFAAPI,
             Submission.Record(
-                id = response["submitid"],
-                title = response["title"],
-                author = response["owner"],
-                rating = convertRating(response["rating"]),
-                type = computeTypeFromExtension(response["media"]["submission"][0]["url"].split(".")[-1], response["submitid"]),
+                **{field: response[key] for key, field in submission_json_renames},
+                rating = ratings[response["rating"]],
+                type = computeTypeFromExtension(file_url.rpartition(".")[2], response["submitid"]),
                 thumbnail_url = response["media"]["thumbnail-generated"][0]["url"],
                 author_title = "",
                 author_icon_url = response["owner_media"]["avatar"][0]["url"],
-                date = parse_date(response["posted_at"]),
-                tags = response["tags"],
+                date = parse_iso_date(response["posted_at"]),
                 category = "",
                 species = "",
                 gender = "",
-                views = response["views"],
-                comment_count = response["comments"],
-                favorites = response["favorites"],
-                description = response["description"],
                 footer = "",
                 mentions = [],
                 folder = "gallery",
-                user_folders = [SubmissionUserFolder(response["folder_name"], f"{self.root()}submissions/{response['owner_login']}?folderid={response['folderid']}", "")],
-                file_url = response["media"]["submission"][0]["url"],
+                user_folders = [SubmissionUserFolder(response["folder_name"], f"{root}submissions/{response['owner_login']}?folderid={response['folderid']}", "")],
+                file_url = file_url,
                 prev = 0,
                 next = 0,
-                favorite = response["favorited"],
                 favorite_toggle_link = "",
             )
         )
                 
-        sub_file: list[bytes] = self.submission_file(sub, chunk_size=chunk_size) if get_file and sub.id else []
+        sub_file: list[bytes] = self.submission_files(sub, chunk_size=chunk_size) if get_file and sub.id else []
         return sub, sub_file
 
     def journal(self, journal_id: int) -> Journal:
@@ -207,10 +229,10 @@ class WeasylFAAPI(FAAPI_BASE):
             user_name = response["owner"],
             user_title = "",
             user_status = "",
-            user_join_date = datetime.fromtimestamp(0, tz = tzutc()),
+            user_join_date = epoch_utc,
             user_icon_url = response["owner_media"]["avatar"][0]["url"],
             comments = response["comments"],
-            date = parse_date(response["posted_at"]),
+            date = parse_iso_date(response["posted_at"]),
             content = response["content"],
             header = "",
             footer = "",
@@ -227,25 +249,23 @@ class WeasylFAAPI(FAAPI_BASE):
         def parseUserInfo(user_info: Any) -> Tuple[Dict[str, str], Dict[str, str]]:
             contacts = user_info.pop("user_links")
             del user_info["sorted_user_links"]
-            result: Dict[str, str] = {}
-            for location in contacts:
-                urls = contacts[location]
-                if len(urls) == 1:
-                    result[location] = urls[0]
-                else:
-                    for (i, url) in enumerate(urls):
-                        result[f"{location} {i+1}"] = url
+            result: Dict[str, str] = {
+                location if len(urls) == 1 else f"{location} {i+1}": url
+                for location, urls in contacts.items()
+                for (i, url) in enumerate(urls)
+            }
             return user_info, result
 
         response: Any = self.get_json(f"/api/users/{user}/view")
         assert response["username"] == user
         user_info, contact_info = parseUserInfo(response["user_info"])
+        user_info.update(response["commission_info"])
         return User(WeasylFAAPI, User.Record(
             name = response["username"],
             status = response["catchphrase"],
             profile = response["profile_text"],
             title = response["full_name"],
-            join_date = parse_date(response["created_at"]),
+            join_date = parse_iso_date(response["created_at"]),
             stats = UserStats(
                 views = response["statistics"]["page_views"],
                 submissions = response["statistics"]["submissions"],
@@ -256,7 +276,7 @@ class WeasylFAAPI(FAAPI_BASE):
                 watched_by = response["statistics"]["followed"],
                 watching = response["statistics"]["following"]
             ),
-            info = user_info | response["commission_info"],
+            info = user_info,
             contacts = contact_info,
             user_icon_url = response["media"]["avatar"][0]["url"],
             watched = response["relationship"]["follow"],
@@ -278,25 +298,17 @@ class WeasylFAAPI(FAAPI_BASE):
         if page != None and page != 1:
             response = self.get_json(f"/api/users/{user}/gallery", nextid = page)
         else:
-            print(f"/api/users/{user}/gallery")
             response = self.get_json(f"/api/users/{user}/gallery")
             
         author: UserPartial = UserPartial(WeasylFAAPI, UserPartial.Record(
             name = user,
             status = "",
             title = "",
-            join_date = datetime.fromtimestamp(0, tz = tzutc()),
+            join_date = epoch_utc,
             user_icon_url = ""
         ))
-        submissions = [SubmissionPartial(WeasylFAAPI, SubmissionPartial.Record(
-            id = s["submitid"],
-            title = s["title"],
-            rating = convertRating(s["rating"]),
-            type = computeTypeFromExtension(s["media"]["thumbnail"][0]["url"].split(".")[-1], s["submitid"]),
-            thumbnail_url = s["media"]["thumbnail"][0]["url"]
-        )) for s in response["submissions"]]
-        for s in submissions:
-            s.author = author
+        submissions: list[SubmissionPartial] = [SubmissionPartial(WeasylFAAPI, parse_submission_json(s), author=author)
+                                                for s in response["submissions"]]
         return (submissions, response["nextid"], [])
 
     # noinspection DuplicatedCode
@@ -352,27 +364,29 @@ class WeasylFAAPI(FAAPI_BASE):
         page_parsed: BeautifulSoup = self.get_parsed(f"journals/{user}")
         user_info = parse_user_folder(page_parsed)
         assert user_info["user_name"] == user
-        journal_tags = page_parsed.select(".text-post-item")
-        header_tags = page_parsed.select(".text-post-group-header")
+        header_tags: list[Tag] = []
+        journal_tags: list[Tag] = []
+        for tag in journal_list_selector.select(page_parsed):
+            (header_tags if "text-post-group-header" in tag.get("class", ()) else journal_tags).append(tag)
 
         journals : List[JournalPartial] = []
         for (header, journal) in zip(header_tags, journal_tags):
-            title_tag = journal.select_one(".text-post-title").a
+            title_tag = journal_title_selector.select_one(journal).a
             assert title_tag is not None
-            excerpt_tag = journal.select_one(".text-post-excerpt")
+            excerpt_tag = journal_excerpt_selector.select_one(journal)
             assert excerpt_tag is not None
             journals.append(JournalPartial(WeasylFAAPI, JournalPartial.Record(
             id = int(title_tag.attrs["href"].split("/")[2]),
             title = title_tag.text,
             comments = 0,
-            date = parse_date(header.time.attrs["datetime"]),
+            date = parse_iso_date(header.time.attrs["datetime"]),
             content = excerpt_tag.text,
             mentions = [],
             **user_info)))
         
         return (journals, None, [])
         
-    def watchlist_to(self, user: str, page: Any = 1) -> tuple[list[UserPartial], Optional[Any], list[Any]]:
+    def watchlist_to(self, user: str, page: Any = None) -> tuple[list[UserPartial], Optional[Any], list[Any]]:
         """
         Fetch a page from the list of users watching the user.
 
@@ -380,52 +394,28 @@ class WeasylFAAPI(FAAPI_BASE):
         :param page: The page to fetch.
         :return: A list of UserPartial objects and the next page (None if it is the last).
         """
-        page_parsed: BeautifulSoup = self.get_parsed(f"followed/{user}")
-        follower_tags = page_parsed.select(".grid-unit")
-        followers = [UserPartial(WeasylFAAPI, UserPartial.Record(
-            name = tag.a.attrs["title"],
-            status = "",
-            title = "",
-            join_date = datetime.fromtimestamp(0, tz = tzutc()),
-            user_icon_url = tag.img.attrs["src"]
-        )) for tag in follower_tags]
-        
-        next_page = None
-        href_re = re.compile("/following\\?userid=.*&nextid=(.*)")
-        def match_href(url: str):
-            match = href_re.match(url)
-            if match:
-                nonlocal next_page
-                next_page = match[1]
-        page_parsed.find("a", href=match_href)
-        return (followers, next_page, [])
-
-    def watchlist_by(self, user: str, page: Any = 1) -> tuple[list[UserPartial], Optional[Any], list[Any]]:
+        return self._watchlist(f"followed/{user}", page)
+
+    def watchlist_by(self, user: str, page: Any = None) -> tuple[list[UserPartial], Optional[Any], list[Any]]:
         """
         Fetch a page from the list of users watched by the user.
         :param user: The name of the user (_ characters are allowed).
         :param page: The page to fetch.
         :return: A list of UserPartial objects and the next page (None if it is the last).
         """
-        page_parsed: BeautifulSoup = self.get_parsed(f"following/{user}")
-        follower_tags = page_parsed.select(".grid-unit")
+        return self._watchlist(f"following/{user}", page)
+
+    def _watchlist(self, path: str, page: Any) -> tuple[list[UserPartial], Optional[Any], list[Any]]:
+        page_parsed: BeautifulSoup = self.get_parsed(path, **({"nextid": page} if page is not None else {}))
+        watchlist: dict[str, Any] = parse_watchlist_page(page_parsed)
         followers = [UserPartial(WeasylFAAPI, UserPartial.Record(
-            name = tag.a.attrs["title"],
+            name = name,
             status = "",
             title = "",
-            join_date = datetime.fromtimestamp(0, tz = tzutc()),
-            user_icon_url = tag.img.attrs["src"]
-        )) for tag in follower_tags]
-
-        next_page = None
-        href_re = re.compile("/following\\?userid=.*&nextid=(.*)")
-        def match_href(url: str):
-            match = href_re.match(url)
-            if match:
-                nonlocal next_page
-                next_page = match[1]
-        page_parsed.find("a", href=match_href)
-        return (followers, next_page, [])
+            join_date = epoch_utc,
+            avatar_url = icon_url
+        )) for name, icon_url in watchlist["users"]]
+        return (followers, watchlist["next_page"], [])
 
     def parse_loggedin_user(self, page: BeautifulSoup) -> Optional[str]:
         username_tag = page.select_one("#username")
@@ -441,5 +431,6 @@ class WeasylFAAPI(FAAPI_BASE):
         raise NotImplementedError
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def username_url(username: str) -> str:
-        return sub(r"[^a-z\d.~`-]", "", username.lower())
\ No newline at end of file
+        return normalize_username(username)
\ No newline at end of file
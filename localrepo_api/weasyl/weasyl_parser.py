@@ -4,11 +4,9 @@ from re import compile as re_compile
 from re import match
 from re import search
 from re import sub
-import re
 from typing import Any, Dict
 from typing import Optional
 from typing import NewType
-from dateutil.tz import tzutc
 
 from bs4 import BeautifulSoup
 from bs4.element import NavigableString
@@ -22,10 +20,8 @@ from ..exceptions import NotFound
 from ..exceptions import NoticeMessage
 from ..exceptions import ParsingError
 from ..exceptions import ServerError
-from ..exceptions import _raise_exception
 
 from abc import ABC, abstractmethod
-from datetime import datetime
 from re import MULTILINE
 from re import Match
 from re import Pattern
@@ -43,6 +39,8 @@ from bs4.element import NavigableString
 from bs4.element import Tag
 from dateutil.parser import parse as parse_date
 from htmlmin import minify  # type:ignore
+from soupsieve import SoupSieve
+from soupsieve import compile as css_compile
 
 from ..exceptions import DisabledAccount
 from ..exceptions import NoTitle
@@ -51,12 +49,13 @@ from ..exceptions import NotFound
 from ..exceptions import NoticeMessage
 from ..exceptions import ParsingError
 from ..exceptions import ServerError
-from ..exceptions import _raise_exception
+from ..user import epoch_utc
 
 def parse_submission_figure(figure_tag: Tag) -> dict[str, Any]:
     id_link_tag = figure_tag.a
 
-    assert id_link_tag is not None, _raise_exception(ParsingError("Missing ID tag"))
+    if id_link_tag is None:
+        raise ParsingError("Missing ID tag")
 
     id_: int = int(id_link_tag.attrs["href"].split("/")[3])
 
@@ -64,9 +63,12 @@ def parse_submission_figure(figure_tag: Tag) -> dict[str, Any]:
     tag_author: Optional[Tag] = figure_tag.select_one(".byline")
     tag_thumbnail: Optional[Tag] = figure_tag.select_one("img")
 
-    assert tag_title is not None, _raise_exception(ParsingError("Missing title tag"))
-    assert tag_author is not None, _raise_exception(ParsingError("Missing author tag"))
-    assert tag_thumbnail is not None, _raise_exception(ParsingError("Missing thumbnail tag"))
+    if tag_title is None:
+        raise ParsingError("Missing title tag")
+    if tag_author is None:
+        raise ParsingError("Missing author tag")
+    if tag_thumbnail is None:
+        raise ParsingError("Missing thumbnail tag")
 
     title: str = tag_title.attrs["title"]
     author: str = tag_author.attrs["title"][3:]
@@ -88,12 +90,13 @@ def parse_user_tag(user_tag: Tag) -> dict[str, Any]:
     name = user_tag.select_one(".username")
     user_id_tag = user_tag.select_one("#user-id")
 
-    assert user_id_tag is not None, _raise_exception(ParsingError("Missing user id tag"))
+    if user_id_tag is None:
+        raise ParsingError("Missing user id tag")
 
     user_info = user_id_tag.text.split("/")
     title = user_info[0]
     status = user_info[4] if len(user_info) >= 5 else ""
-    join_date: datetime = datetime.fromtimestamp(0, tz = tzutc())
+    join_date: datetime = epoch_utc
 
     return {
         "user_name": name.text.strip(),
@@ -105,11 +108,14 @@ def parse_user_tag(user_tag: Tag) -> dict[str, Any]:
 
 def parse_user_folder(folder_page: BeautifulSoup) -> dict[str, Any]:
     tag_username: Optional[Tag] = folder_page.select_one("#user-info")
-    assert tag_username is not None, _raise_exception(ParsingError("Missing username tag"))
+    if tag_username is None:
+        raise ParsingError("Missing username tag")
     tag_user_icon: Optional[Tag] = tag_username.select_one(".avatar")
-    assert tag_user_icon is not None, _raise_exception(ParsingError("Missing user icon tag"))
+    if tag_user_icon is None:
+        raise ParsingError("Missing user icon tag")
     tag_user_img = tag_user_icon.select_one("img")
-    assert tag_user_img is not None, _raise_exception(ParsingError("Missing user image"))
+    if tag_user_img is None:
+        raise ParsingError("Missing user image")
     return {
         **parse_user_tag(tag_username),
         "user_icon_url": tag_user_img.attrs["src"],
@@ -119,19 +125,13 @@ def parse_user_folder(folder_page: BeautifulSoup) -> dict[str, Any]:
 def parse_submission_figures(figures_page: BeautifulSoup) -> list[Tag]:
     return figures_page.select(".item")
 
+favorites_next_pattern: Pattern = re_compile(r"/favorites\?userid=.*&feature=submit&nextid=(.*)")
+
 def parse_user_favorites(favorites_page: BeautifulSoup) -> dict[str, Any]:
     user_info: dict[str, str] = parse_user_folder(favorites_page)
-    next_page: Optional[str] = None
-    href_re = re.compile("/favorites\\?userid=.*&feature=submit&nextid=(.*)")
-    def match_href(url: str):
-        match = href_re.match(url)
-        if match:
-            nonlocal next_page
-            next_page = match[1]
-            return True
-        return False
-
-    favorites_page.find("a", href=match_href)
+    tag_next: Optional[Tag] = favorites_page.select_one('a[href^="/favorites?userid="][href*="&feature=submit&nextid="]')
+    next_match: Optional[Match] = favorites_next_pattern.match(tag_next.attrs["href"]) if tag_next else None
+    next_page: Optional[str] = next_match[1] if next_match else None
 
     return {
         **user_info,
@@ -141,4 +141,29 @@ def parse_user_favorites(favorites_page: BeautifulSoup) -> dict[str, Any]:
     }
 
 
+watchlist_unit_selector: SoupSieve = css_compile(".grid-unit")
+watchlist_next_selector: SoupSieve = css_compile(
+    'a[href^="/following?userid="][href*="&nextid="], a[href^="/followed?userid="][href*="&nextid="]'
+)
+watchlist_next_pattern: Pattern = re_compile(r"/follow(?:ing|ed)\?userid=.*&nextid=(.*)")
+
+
+def parse_watchlist_page(page: BeautifulSoup) -> dict[str, Any]:
+    users: list[tuple[str, str]] = []
+
+    for unit in watchlist_unit_selector.select(page):
+        tag_link: Optional[Tag] = unit.a
+        tag_icon: Optional[Tag] = unit.img
+        if tag_link is None:
+            raise ParsingError("Missing user link tag")
+        if tag_icon is None:
+            raise ParsingError("Missing user icon tag")
+        users.append((tag_link.attrs["title"], tag_icon.attrs["src"]))
 
+    tag_next: Optional[Tag] = watchlist_next_selector.select_one(page)
+    next_match: Optional[Match] = watchlist_next_pattern.match(tag_next.attrs["href"]) if tag_next else None
+
+    return {
+        "users": users,
+        "next_page": next_match[1] if next_match else None,
+    }
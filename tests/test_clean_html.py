@@ -0,0 +1,15 @@
+from pytest import mark
+
+from localrepo_api.parse import clean_html
+
+
+@mark.parametrize("html", [
+    "<p>a&nbsp;&nbsp;&nbsp;b</p>",
+    "&nbsp;leading and trailing&nbsp;",
+    "<p>a  \n\t b</p>  <!-- comment -->  <b> c </b>",
+    "<pre>  a\n   b  <i> i  </i>  </pre>  tail  <br>  d",
+    "<textarea> t  \n t</textarea>",
+    "<script> var  a =\n 1; </script><style> p  { x: 1 }</style> e  f",
+])
+def test_clean_html_minifiers_agree(html: str):
+    assert clean_html(html, use_htmlmin=False) == clean_html(html, use_htmlmin=True)
@@ -21,9 +21,10 @@ from localrepo_api.exceptions import Unauthorized
 __root__: Path = Path(__file__).resolve().parent
 
 
-@fixture
+@fixture(scope="session")
 def data() -> dict:
-    return load((__root__ / "test_data.json").open())
+    with (__root__ / "test_data.json").open() as f:
+        return load(f)
 
 
 @fixture
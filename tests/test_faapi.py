@@ -1,7 +1,10 @@
+from collections import deque
 from datetime import datetime
 from json import load
 from pathlib import Path
-from re import sub
+from re import Pattern
+from re import compile as re_compile
+from typing import Any
 from typing import Optional
 
 from pytest import fixture
@@ -23,6 +26,7 @@ from localrepo_api.parse import clean_html
 
 
 __root__: Path = Path(__file__).resolve().parent
+user_icon_pattern: Pattern = re_compile(r"a\.furaffinity\.net/\d{8}/[^. ]+\.gif")
 
 
 @fixture
@@ -30,13 +34,32 @@ def cookies(data: dict) -> RequestsCookieJar:
     return data["cookies"]
 
 
+@fixture
+def api(test_data, cookies: RequestsCookieJar) -> FAAPI_ABC:
+    return test_data.backend(cookies)
+
+
 
 def remove_user_icons(html: str) -> str:
-    return sub(r"a\.furaffinity\.net/\d{8}/[^. ]+.gif", "", html)
+    return user_icon_pattern.sub("", html)
+
+
+def normalize_html(html: str) -> str:
+    return remove_user_icons(clean_html(html))
 
 
-def test_robots(test_data, cookies: RequestsCookieJar):
-    api: FAAPI_ABC = test_data.backend(cookies)
+def assert_same_html(*htmls: str):
+    first, *rest = map(normalize_html, htmls)
+    for html in rest:
+        assert html == first
+
+
+def assert_same_fields(obj: Any, obj_dict: dict, test_data: dict, *fields: str):
+    for field in fields:
+        assert getattr(obj, field) == obj_dict[field] == test_data[field], field
+
+
+def test_robots(test_data, api: FAAPI_ABC):
     assert getattr(api.robots, "default_entry") is not None
     assert api.crawl_delay >= 1
     for endpoint in test_data.data["endpoints"]:
@@ -46,8 +69,7 @@ def test_robots(test_data, cookies: RequestsCookieJar):
             assert not api.check_path(endpoint, raise_for_disallowed=True)
 
 
-def test_login(test_data, cookies: RequestsCookieJar):
-    api: FAAPI_ABC = test_data.backend(cookies)
+def test_login(api: FAAPI_ABC):
     assert api.login_status
     assert api.connection_status
 
@@ -57,8 +79,7 @@ def test_login(test_data, cookies: RequestsCookieJar):
 
 
 # noinspection DuplicatedCode
-def test_frontpage(test_data, cookies: RequestsCookieJar):
-    api: FAAPI_ABC = test_data.backend(cookies)
+def test_frontpage(api: FAAPI_ABC):
 
     ss = api.frontpage()
 
@@ -71,77 +92,58 @@ def test_frontpage(test_data, cookies: RequestsCookieJar):
         assert submission.thumbnail_url != ""
 
 
-def test_user(test_data, cookies: RequestsCookieJar, user_test_data: dict):
-    api: FAAPI_ABC = test_data.backend(cookies)
+def test_user(api: FAAPI_ABC, user_test_data: dict):
 
     user = api.user(user_test_data["name"])
     user_dict = dict(user)
 
-    assert user.name == user_dict["name"] == user_test_data["name"]
-    assert user.status == user_dict["status"] == user_test_data["status"]
-    assert user.title == user_dict["title"] == user_test_data["title"]
-    assert user.join_date == user_dict["join_date"] == user_test_data["join_date"]
-    assert user.stats.views == user_dict["stats"]["views"]
-    assert user_dict["stats"]["views"] >= user_test_data["stats"]["views"]
-    assert user.stats.submissions == user_dict["stats"]["submissions"]
-    assert user_dict["stats"]["submissions"] >= user_test_data["stats"]["submissions"]
-    assert user.stats.favorites == user_dict["stats"]["favorites"]
-    assert user_dict["stats"]["favorites"] >= user_test_data["stats"]["favorites"]
-    assert user.stats.comments_earned == user_dict["stats"]["comments_earned"]
-    assert user_dict["stats"]["comments_earned"] >= user_test_data["stats"]["comments_earned"]
-    assert user.stats.comments_made == user_dict["stats"]["comments_made"]
-    assert user_dict["stats"]["comments_made"] >= user_test_data["stats"]["comments_made"]
-    assert user.stats.journals == user_dict["stats"]["journals"]
-    assert user_dict["stats"]["journals"] >= user_test_data["stats"]["journals"]
-    assert user.info == user_dict["info"] == user_test_data["info"]
-    assert user.contacts == user_dict["contacts"] == user_test_data["contacts"]
+    assert_same_fields(user, user_dict, user_test_data, "name", "status", "title", "join_date")
+    stats, stats_dict, stats_test_data = user.stats, user_dict["stats"], user_test_data["stats"]
+    assert stats.views == stats_dict["views"]
+    assert stats_dict["views"] >= stats_test_data["views"]
+    assert stats.submissions == stats_dict["submissions"]
+    assert stats_dict["submissions"] >= stats_test_data["submissions"]
+    assert stats.favorites == stats_dict["favorites"]
+    assert stats_dict["favorites"] >= stats_test_data["favorites"]
+    assert stats.comments_earned == stats_dict["comments_earned"]
+    assert stats_dict["comments_earned"] >= stats_test_data["comments_earned"]
+    assert stats.comments_made == stats_dict["comments_made"]
+    assert stats_dict["comments_made"] >= stats_test_data["comments_made"]
+    assert stats.journals == stats_dict["journals"]
+    assert stats_dict["journals"] >= stats_test_data["journals"]
+    assert_same_fields(user, user_dict, user_test_data, "info", "contacts")
     assert user.avatar_url == user_dict["avatar_url"] != ""
     assert user.banner_url == user_dict["banner_url"] != ""
-    assert remove_user_icons(clean_html(user.profile)) == \
-           remove_user_icons(clean_html(user_dict["profile"])) == \
-           remove_user_icons(clean_html(user_test_data["profile"]))
+    assert_same_html(user.profile, user_dict["profile"], user_test_data["profile"])
     # assert user.profile_bbcode == user_test_data["profile_bbcode"]
 
 
 # noinspection DuplicatedCode
-def test_submission(test_data, cookies: RequestsCookieJar, submission_test_data: dict):
-    api: FAAPI_ABC = test_data.backend(cookies)
+def test_submission(api: FAAPI_ABC, submission_test_data: dict):
 
     submission, files = api.submission(submission_test_data["id"], get_file=True)
     submission_dict = dict(submission)
 
-    assert submission.id == submission_dict["id"] == submission_test_data["id"]
-    assert submission.title == submission_dict["title"] == submission_test_data["title"]
-    assert submission.author.name == submission_dict["author"]["name"] == submission_test_data["author"]["name"]
+    assert_same_fields(submission, submission_dict, submission_test_data, "id", "title")
+    assert_same_fields(submission.author, submission_dict["author"], submission_test_data["author"], "name")
     assert submission.author.avatar_url == submission_dict["author"]["avatar_url"] != ""
-    assert submission.date == submission_dict["date"] == submission_test_data["date"]
-    assert submission.tags == submission_dict["tags"] == submission_test_data["tags"]
-    assert submission.category == submission_dict["category"] == submission_test_data["category"]
-    assert submission.species == submission_dict["species"] == submission_test_data["species"]
-    assert submission.gender == submission_dict["gender"] == submission_test_data["gender"]
-    assert submission.rating == submission_dict["rating"] == submission_test_data["rating"]
-    assert submission.stats.views == submission_dict["stats"]["views"]
-    assert submission.stats.views >= submission_test_data["stats"]["views"]
-    assert submission.stats.comments == submission_dict["stats"]["comments"]
-    assert submission.stats.comments >= submission_test_data["stats"]["comments"]
-    assert submission.stats.favorites == submission_dict["stats"]["favorites"]
-    assert submission.stats.favorites >= submission_test_data["stats"]["favorites"]
-    assert submission.type == submission_dict["type"] == submission_test_data["type"]
-    assert submission.mentions == submission_dict["mentions"] == submission_test_data["mentions"]
-    assert submission.folder == submission_dict["folder"] == submission_test_data["folder"]
+    assert_same_fields(submission, submission_dict, submission_test_data,
+                       "date", "tags", "category", "species", "gender", "rating")
+    stats, stats_dict, stats_test_data = submission.stats, submission_dict["stats"], submission_test_data["stats"]
+    assert stats.views == stats_dict["views"]
+    assert stats.views >= stats_test_data["views"]
+    assert stats.comments == stats_dict["comments"]
+    assert stats.comments >= stats_test_data["comments"]
+    assert stats.favorites == stats_dict["favorites"]
+    assert stats.favorites >= stats_test_data["favorites"]
+    assert_same_fields(submission, submission_dict, submission_test_data, "type", "mentions", "folder")
     assert submission.file_url == submission_dict["file_url"] != ""
     assert submission.thumbnail_url == submission_dict["thumbnail_url"] != ""
-    assert submission.prev == submission_dict["prev"] == submission_test_data["prev"]
-    assert submission.next == submission_dict["next"] == submission_test_data["next"]
-    assert submission.favorite == submission_dict["favorite"] == submission_test_data["favorite"]
+    assert_same_fields(submission, submission_dict, submission_test_data, "prev", "next", "favorite")
     assert bool(submission.favorite_toggle_link) == bool(submission_dict["favorite_toggle_link"]) == \
            bool(submission_test_data["favorite_toggle_link"])
-    assert remove_user_icons(clean_html(submission.description)) == \
-           remove_user_icons(clean_html(submission_dict["description"])) == \
-           remove_user_icons(clean_html(submission_test_data["description"]))
-    assert remove_user_icons(clean_html(submission.footer)) == \
-           remove_user_icons(clean_html(submission_dict["footer"])) == \
-           remove_user_icons(clean_html(submission_test_data["footer"]))
+    assert_same_html(submission.description, submission_dict["description"], submission_test_data["description"])
+    assert_same_html(submission.footer, submission_dict["footer"], submission_test_data["footer"])
     #assert submission.description_bbcode == submission_test_data["description_bbcode"]
     #assert submission.footer_bbcode == submission_test_data["footer_bbcode"]
 
@@ -149,16 +151,19 @@ def test_submission(test_data, cookies: RequestsCookieJar, submission_test_data:
     for file in files:
         assert(len(file)) > 0
 
-    assert len(faapi.comment.flatten_comments(submission.comments)) == submission.stats.comments
+    flat_comments: list[Comment] = faapi.comment.flatten_comments(submission.comments)
+    assert len(flat_comments) == submission.stats.comments
+
+    comments: dict[int, Comment] = {c.id: c for c in flat_comments}
 
-    comments: dict[int, Comment] = {c.id: c for c in faapi.comment.flatten_comments(submission.comments)}
+    reply_ids: dict[int, set[int]] = {c.id: {r.id for r in c.replies} for c in comments.values()}
 
     for comment in comments.values():
         assert comment.reply_to is None or isinstance(comment.reply_to, Comment)
 
         if comment.reply_to:
             assert comment.reply_to.id in comments
-            assert comment in comments[comment.reply_to.id].replies
+            assert comment.id in reply_ids[comment.reply_to.id]
 
         if comment.replies:
             for reply in comment.replies:
@@ -166,44 +171,36 @@ def test_submission(test_data, cookies: RequestsCookieJar, submission_test_data:
 
 
 # noinspection DuplicatedCode
-def test_journal(test_data, cookies: RequestsCookieJar, journal_test_data: dict):
-    api: FAAPI_ABC = test_data.backend(cookies)
+def test_journal(api: FAAPI_ABC, journal_test_data: dict):
 
     journal = api.journal(journal_test_data["id"])
     journal_dict = dict(journal)
 
-    assert journal.id == journal_dict["id"] == journal_test_data["id"]
-    assert journal.title == journal_dict["title"] == journal_test_data["title"]
-    assert journal.author.name == journal_dict["author"]["name"] == journal_test_data["author"]["name"]
-    assert journal.author.join_date == journal_dict["author"]["join_date"] == \
-           journal_test_data["author"]["join_date"]
+    assert_same_fields(journal, journal_dict, journal_test_data, "id", "title")
+    assert_same_fields(journal.author, journal_dict["author"], journal_test_data["author"], "name", "join_date")
     assert journal.author.avatar_url == journal_dict["author"]["avatar_url"] != ""
-    assert journal.date == journal_dict["date"] == journal_test_data["date"]
+    assert_same_fields(journal, journal_dict, journal_test_data, "date", "mentions")
     assert journal.stats.comments == journal_dict["stats"]["comments"] >= journal_test_data["stats"]["comments"]
-    assert journal.mentions == journal_dict["mentions"] == journal_test_data["mentions"]
-    #assert remove_user_icons(clean_html(journal.content)) == \
-    #       remove_user_icons(clean_html(journal_dict["content"])) == \
-    #       remove_user_icons(clean_html(journal_test_data["content"]))
-    assert remove_user_icons(clean_html(journal.header)) == \
-           remove_user_icons(clean_html(journal_dict["header"])) == \
-           remove_user_icons(clean_html(journal_test_data["header"]))
-    assert remove_user_icons(clean_html(journal.footer)) == \
-           remove_user_icons(clean_html(journal_dict["footer"])) == \
-           remove_user_icons(clean_html(journal_test_data["footer"]))
+    #assert_same_html(journal.content, journal_dict["content"], journal_test_data["content"])
+    assert_same_html(journal.header, journal_dict["header"], journal_test_data["header"])
+    assert_same_html(journal.footer, journal_dict["footer"], journal_test_data["footer"])
     #assert journal.content_bbcode == journal_test_data["content_bbcode"]
     #assert journal.header_bbcode == journal_test_data["header_bbcode"]
     #assert journal.footer_bbcode == journal_test_data["footer_bbcode"]
 
-    # assert len(faapi.comment.flatten_comments(journal.comments)) == journal.stats.comments
+    flat_comments: list[Comment] = faapi.comment.flatten_comments(journal.comments)
+    # assert len(flat_comments) == journal.stats.comments
 
-    comments: dict[int, Comment] = {c.id: c for c in faapi.comment.flatten_comments(journal.comments)}
+    comments: dict[int, Comment] = {c.id: c for c in flat_comments}
+
+    reply_ids: dict[int, set[int]] = {c.id: {r.id for r in c.replies} for c in comments.values()}
 
     for comment in comments.values():
         assert comment.reply_to is None or isinstance(comment.reply_to, Comment)
 
         if comment.reply_to:
             assert comment.reply_to.id in comments
-            assert comment in comments[comment.reply_to.id].replies
+            assert comment.id in reply_ids[comment.reply_to.id]
 
         if comment.replies:
             for reply in comment.replies:
@@ -211,187 +208,169 @@ def test_journal(test_data, cookies: RequestsCookieJar, journal_test_data: dict)
 
 
 # noinspection DuplicatedCode
-def test_gallery(test_data, cookies: RequestsCookieJar, data: dict):
-    api: FAAPI_ABC = test_data.backend(cookies)
+def test_gallery(api: FAAPI_ABC, data: dict):
 
-    ss: list[SubmissionPartial] = []
+    seen_ids: set[int] = set()
+    name_url: str = username_url(data["gallery"]["user"])
 
-    pending_pages: list[Any] = [None]
+    pending_pages: deque[Any] = deque([None])
 
-    while len(pending_pages) > 0:
-        p = pending_pages.pop()
+    while pending_pages:
+        p = pending_pages.popleft()
         ss_, p_, subpages_ = api.gallery(data["gallery"]["user"], p)
-        assert isinstance(ss, list)
-        assert all(isinstance(s, SubmissionPartial) for s in ss_)
+        for s in ss_:
+            assert isinstance(s, SubmissionPartial)
+            assert s.id not in seen_ids
+            seen_ids.add(s.id)
+            assert s.id > 0
+            assert s.type != ""
+            assert s.rating != ""
+            assert s.thumbnail_url != ""
+            assert s.author.name_url == name_url
         assert p_ is None or isinstance(p_, int)
         assert p_ is None or p_ > p
         assert len(ss_) or p_ is None
 
-        ss.extend(ss_)
         pending_pages.extend(subpages_)
         if p_ is not None:
             pending_pages.append(p_)
 
-    assert len(ss) >= data["gallery"]["length"]
-    assert len({s.id for s in ss}) == len(ss)
-
-    for submission in ss:
-        assert submission.id > 0
-        assert submission.type != ""
-        assert submission.rating != ""
-        assert submission.thumbnail_url != ""
-        assert submission.author.name_url == username_url(data["gallery"]["user"])
+    assert len(seen_ids) >= data["gallery"]["length"]
 
 
 # noinspection DuplicatedCode
-def test_scraps(test_data, cookies: RequestsCookieJar, data: dict):
-    api: FAAPI_ABC = test_data.backend(cookies)
+def test_scraps(api: FAAPI_ABC, data: dict):
 
-    ss: list[SubmissionPartial] = []
+    seen_ids: set[int] = set()
+    name_url: str = username_url(data["scraps"]["user"])
 
-    pending_pages: list[Any] = [None]
+    pending_pages: deque[Any] = deque([None])
 
-    while len(pending_pages) > 0:
-        p = pending_pages.pop()
+    while pending_pages:
+        p = pending_pages.popleft()
         ss_, p_, subpages_ = api.scraps(data["scraps"]["user"], p)
-        assert isinstance(ss, list)
-        assert all(isinstance(s, SubmissionPartial) for s in ss_)
+        assert len(seen_ids) or p is None
+        for s in ss_:
+            assert isinstance(s, SubmissionPartial)
+            assert s.id not in seen_ids
+            seen_ids.add(s.id)
+            assert s.id > 0
+            assert s.type != ""
+            assert s.rating != ""
+            assert s.thumbnail_url != ""
+            assert s.author.name_url == name_url
         assert p_ is None or isinstance(p_, int)
         assert p_ is None or p_ > p
-        assert len(ss) or p is None
         assert len(ss_) or p_ is None
 
-        ss.extend(ss_)
         pending_pages.extend(subpages_)
         if p_ is not None:
             pending_pages.append(p_)
 
-    assert len(ss) >= data["scraps"]["length"]
-    assert len({s.id for s in ss}) == len(ss)
-
-    for submission in ss:
-        assert submission.id > 0
-        assert submission.type != ""
-        assert submission.rating != ""
-        assert submission.thumbnail_url != ""
-        assert submission.author.name_url == username_url(data["scraps"]["user"])
+    assert len(seen_ids) >= data["scraps"]["length"]
 
 
 # noinspection DuplicatedCode
-def test_favorites(test_data, cookies: RequestsCookieJar, data: dict):
-    api: FAAPI_ABC = test_data.backend(cookies)
+def test_favorites(api: FAAPI_ABC, data: dict):
 
-    ss: list[SubmissionPartial] = []
+    seen_ids: set[int] = set()
     p: Optional[str] = None
 
-    pending_pages: list[Any] = [None]
+    pending_pages: deque[Any] = deque([None])
 
-    while len(ss) < data["favorites"]["max_length"]:
-        p = pending_pages.pop()
+    while pending_pages and len(seen_ids) < data["favorites"]["max_length"]:
+        p = pending_pages.popleft()
         ss_, p_, subpages_ = api.favorites(data["favorites"]["user"], p)
-        assert isinstance(ss, list)
-        assert all(isinstance(s, SubmissionPartial) for s in ss_)
+        for s in ss_:
+            assert isinstance(s, SubmissionPartial)
+            assert s.id not in seen_ids
+            seen_ids.add(s.id)
+            assert s.id > 0
+            assert s.type != ""
+            assert s.rating != ""
+            assert s.thumbnail_url != ""
         assert len(ss_) or p_ is None
 
-        ss.extend(ss_)
         pending_pages.extend(subpages_)
         if p_ is not None:
             pending_pages.append(p_)
 
-        if len(pending_pages) == 0:
-            break
-
-    assert len(ss) >= data["favorites"]["length"]
-    assert len({s.id for s in ss}) == len(ss)
-
-    for submission in ss:
-        assert submission.id > 0
-        assert submission.type != ""
-        assert submission.rating != ""
-        assert submission.thumbnail_url != ""
+    assert len(seen_ids) >= data["favorites"]["length"]
 
 
 # noinspection DuplicatedCode
-def test_journals(test_data, cookies: RequestsCookieJar, data: dict):
-    api: FAAPI_ABC = test_data.backend(cookies)
+def test_journals(api: FAAPI_ABC, data: dict):
 
-    js: list[JournalPartial] = []
+    seen_ids: set[int] = set()
+    name_url: str = username_url(data["journals"]["user"])
     p: Optional[int] = None
-    i = 0
     while True:
         js_, p_, subpages_ = api.journals(data["journals"]["user"], p)
-        i+=1
         assert len(subpages_) == 0
-        assert isinstance(js, list)
-        assert all(isinstance(s, JournalPartial) for s in js_)
-        assert len(js) or p == None
+        assert len(seen_ids) or p is None
+        for j in js_:
+            assert isinstance(j, JournalPartial)
+            assert j.id not in seen_ids
+            seen_ids.add(j.id)
+            assert j.id > 0
+            # assert j.author.join_date.timestamp() > 0
+            assert j.date.timestamp() > 0
+            assert j.author.name_url == name_url
         assert len(js_) or p_ is None
 
-        js.extend(js_)
         p = p_
 
         if not p:
             break
 
-    assert len(js) >= data["journals"]["length"]
-    assert len({j.id for j in js}) == len(js)
-
-    for journal in js:
-        assert journal.id > 0
-        # assert journal.author.join_date.timestamp() > 0
-        assert journal.date.timestamp() > 0
-        assert journal.author.name_url == username_url(data["journals"]["user"])
+    assert len(seen_ids) >= data["journals"]["length"]
 
 
 # noinspection DuplicatedCode
-def test_watchlist_to(test_data, cookies: RequestsCookieJar, data: dict):
-    api: FAAPI_ABC = test_data.backend(cookies)
+def test_watchlist_to(api: FAAPI_ABC, data: dict):
     assert api.login_status
 
-    ws: list[UserPartial] = []
+    seen_names: set[str] = set()
     p: Optional[int] = None
 
     while True:
         ws_, p_, subpages_ = api.watchlist_to(data["watchlist"]["user"], p)
         assert len(subpages_) == 0
-        assert isinstance(ws, list)
-        assert all(isinstance(s, UserPartial) for s in ws_)
+        assert len(seen_names) or p is None
+        for w in ws_:
+            assert isinstance(w, UserPartial)
+            assert w.name_url not in seen_names
+            seen_names.add(w.name_url)
         assert p_ is None or isinstance(p_, int)
         assert p_ is None or p_ > p
-        assert len(ws) or p is None
         assert len(ws_) or p_ is None
 
-        ws.extend(ws_)
         p = p_
 
         if not p:
             break
 
-    assert len({w.name_url for w in ws}) == len(ws)
-
 
 # noinspection DuplicatedCode
-def test_watchlist_by(test_data, cookies: RequestsCookieJar, data: dict):
-    api: FAAPI_ABC = test_data.backend(cookies)
+def test_watchlist_by(api: FAAPI_ABC, data: dict):
     assert api.login_status
 
-    ws: list[UserPartial] = []
+    seen_names: set[str] = set()
     p: Optional[int] = None
 
     while True:
         ws_, p_, subpages_ = api.watchlist_by(data["watchlist"]["user"], p)
         assert len(subpages_) == 0
-        assert isinstance(ws, list)
-        assert all(isinstance(s, UserPartial) for s in ws_)
+        assert len(seen_names) or p is None
+        for w in ws_:
+            assert isinstance(w, UserPartial)
+            assert w.name_url not in seen_names
+            seen_names.add(w.name_url)
         assert p_ is None or isinstance(p_, int)
         assert p_ is None or p_ > p
-        assert len(ws) or p is None
         assert len(ws_) or p_ is None
 
-        ws.extend(ws_)
         p = p_
 
         if not p:
             break
-
-    assert len({w.name_url for w in ws}) == len(ws)
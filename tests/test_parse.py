@@ -28,9 +28,10 @@ from localrepo_api.parse import username_url
 __root__: Path = Path(__file__).resolve().parent
 
 
-@fixture
+@fixture(scope="session")
 def data() -> dict:
-    return load((__root__ / "test_data.json").open())
+    with (__root__ / "test_data.json").open() as f:
+        return load(f)
 
 
 @fixture
@@ -40,19 +41,22 @@ def session(data: dict) -> CloudflareScraper:
     return sess
 
 
-@fixture
+@fixture(scope="session")
 def user_test_data() -> dict:
-    return load((__root__ / "test_user.json").open())
+    with (__root__ / "test_user.json").open() as f:
+        return load(f)
 
 
-@fixture
+@fixture(scope="session")
 def submission_test_data() -> dict:
-    return load((__root__ / "test_submission.json").open())
+    with (__root__ / "test_submission.json").open() as f:
+        return load(f)
 
 
-@fixture
+@fixture(scope="session")
 def journal_test_data() -> dict:
-    return load((__root__ / "test_journal.json").open())
+    with (__root__ / "test_journal.json").open() as f:
+        return load(f)
 
 
 def remove_user_icons(html: str) -> str:
@@ -0,0 +1,29 @@
+from bs4 import BeautifulSoup
+
+from localrepo_api.sofurry.sofurry_parser import folder_link_selector
+from localrepo_api.sofurry.sofurry_parser import parse_folder_id
+
+
+def links_page(*hrefs: str) -> BeautifulSoup:
+    return BeautifulSoup("".join(f'<a href="{href}">link</a>' for href in hrefs), "lxml")
+
+
+def test_parse_folder_id():
+    page = links_page("/browse/folder/stories?by=1234&amp;folder=5678")
+    assert parse_folder_id(folder_link_selector.select_one(page)) == "5678"
+
+
+def test_parse_folder_id_skips_absolute_links():
+    page = links_page("https://www.sofurry.com/browse/folder/stories?by=1234&amp;folder=1111",
+                      "/browse/folder/stories?by=1234&amp;folder=5678")
+    assert parse_folder_id(folder_link_selector.select_one(page)) == "5678"
+
+
+def test_parse_folder_id_skips_links_without_folder():
+    page = links_page("/browse/folder/stories?by=1234", "/browse/folder/stories?by=1234&amp;folder=5678")
+    assert parse_folder_id(folder_link_selector.select_one(page)) == "5678"
+
+
+def test_parse_folder_id_missing():
+    page = links_page("/browse/user/stories?uid=1234")
+    assert parse_folder_id(folder_link_selector.select_one(page)) is None